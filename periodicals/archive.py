@@ -0,0 +1,97 @@
+from typing import Iterable, Iterator
+# local imports
+import ei
+import utils
+from protocache import ProtoCache
+
+# side index for the contract archive
+# caches the handful of fields needed to decide whether a stored contract could
+# still be live, and to look contracts up by season or egg, so expired contracts
+# never have to be decoded
+INDEX_FIELDS = ('id', 'start_time', 'expiration_time', 'season_id', 'egg', 'custom_egg_id')
+
+# index entry formatted to persist with json
+class ContractIndexEntry(dict):
+    def __init__(self, contract: "ei.Contract"):
+        dict.__init__(self,
+        id              = contract.identifier,
+        start_time      = contract.start_time,
+        expiration_time = contract.expiration_time,
+        season_id       = contract.season_id,
+        egg             = int(contract.egg),
+        custom_egg_id   = contract.custom_egg_id)
+
+    # entry from the fields utils.scanContracts read off the wire
+    @classmethod
+    def scanned(cls, fields: dict) -> "ContractIndexEntry":
+        entry = cls.__new__(cls)
+        dict.__init__(entry,
+        id              = fields['identifier'],
+        start_time      = fields['start_time'],
+        expiration_time = fields['expiration_time'],
+        season_id       = fields['season_id'],
+        egg             = fields['egg'],
+        custom_egg_id   = fields['custom_egg_id'])
+        return entry
+
+# index entries are scanned straight off the wire, no contract is built for them
+def contractEntry(proto: str) -> ContractIndexEntry:
+    return ContractIndexEntry.scanned(next(utils.scanContracts([{ 'proto': proto }])))
+
+# same for contractseasons.json
+SEASON_INDEX_FIELDS = ('id', 'name', 'start_time')
+
+class ContractSeasonIndexEntry(dict):
+    def __init__(self, season: "ei.ContractSeasonInfo"):
+        dict.__init__(self,
+        id         = season.id,
+        name       = season.name,
+        start_time = season.start_time)
+
+def seasonEntry(proto: str) -> ContractSeasonIndexEntry:
+    return ContractSeasonIndexEntry(utils.decode(ei.ContractSeasonInfo(), proto, False))
+
+def seasonCache(index_file: str) -> ProtoCache:
+    return ProtoCache.load(index_file, seasonEntry, SEASON_INDEX_FIELDS)
+
+class ContractArchive:
+    def __init__(self, file: str, cache: ProtoCache):
+        # file: [{ id: contract id, proto: b64 contract proto }] json archive
+        self.file = file
+        self.cache = cache
+
+    @classmethod
+    def load(cls, file: str, index_file: str) -> "ContractArchive":
+        return cls(file, ProtoCache.load(index_file, contractEntry, INDEX_FIELDS))
+
+    # number of protos that had to be decoded because the index didn't know them
+    @property
+    def misses(self) -> int:
+        return self.cache.misses
+
+    # stream the stored contracts, each call reads the archive again
+    def stores(self) -> Iterator[dict]:
+        return utils.iterJsonArray(self.file)
+
+    # index entry for a store, decoding the proto only if it isn't indexed yet
+    def entry(self, store: dict) -> dict:
+        return self.cache.get(store['proto'])
+
+    # record the index entry of a freshly encoded contract
+    def record(self, store: dict, contract: "ei.Contract"):
+        self.cache.put(store['proto'], ContractIndexEntry(contract))
+
+    # stores of contracts that can no longer be running, passed through untouched
+    def expired(self, now: float) -> Iterator[dict]:
+        return (store for store in self.stores() if self.entry(store)['expiration_time'] <= now)
+
+    # decoded contracts that may still be running
+    def live(self, now: float) -> list["ei.Contract"]:
+        return utils.decodeMany(ei.Contract, [store['proto'] for store in self.stores()
+                                              if self.entry(store)['expiration_time'] > now])
+
+    # persist the index, aging out entries for stores that left the archive
+    def saveIndex(self, stores: Iterable[dict], index_file: str):
+        for store in stores:
+            self.entry(store)
+        self.cache.save(index_file)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Find where utils.decodeMany/encodeMany start to gain from the process pool.
+#
+# For growing batch sizes (the archive's contracts repeated as needed) times the
+# serial path against the pool, and reports the smallest size at which the pool
+# wins, i.e. a value for utils.decode_threshold / utils.encode_threshold on this
+# machine. With a single cpu the pool never wins. It also times the base64 step
+# on its own, to show how much of the serial path it accounts for.
+#
+# usage: python3 bench/bulk_codec.py [--workers N] [--sizes 64,256,...] [--repeat N]
+import argparse
+import base64
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ei
+import defaults
+import utils
+
+def timed(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--sizes', default='64,256,1024,4096,16384')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    archive = [store['proto'] for store in utils.iterJsonArray(defaults.contract_file)]
+    results = { 'cpu_count': os.cpu_count(), 'workers': args.workers, 'sizes': {} }
+    crossover = { 'decode': None, 'encode': None }
+    for size in map(int, args.sizes.split(',')):
+        protos = (archive * (size // len(archive) + 1))[:size]
+        messages = utils.decodeMany(ei.Contract, protos, workers=1)
+        raw = [bytes(message) for message in messages]
+        row = {
+            'decode_serial': timed(lambda: utils.decodeMany(ei.Contract, protos, workers=1), args.repeat),
+            'decode_pool': timed(lambda: utils.decodeMany(ei.Contract, protos, workers=args.workers, threshold=0), args.repeat),
+            'encode_serial': timed(lambda: utils.encodeMany(messages, workers=1), args.repeat),
+            'encode_pool': timed(lambda: utils.encodeMany(messages, workers=args.workers, threshold=0), args.repeat),
+            'b64decode': timed(lambda: [base64.b64decode(proto) for proto in protos], args.repeat),
+            'b64encode': timed(lambda: [base64.b64encode(data).decode('utf-8') for data in raw], args.repeat),
+        }
+        for op in crossover:
+            if crossover[op] is None and row[f'{op}_pool'] < row[f'{op}_serial']:
+                crossover[op] = size
+        results['sizes'][size] = row
+        print(f"{size:>6}: decode {row['decode_serial']*1000:8.1f}ms serial {row['decode_pool']*1000:8.1f}ms pool, "
+              f"encode {row['encode_serial']*1000:8.1f}ms serial {row['encode_pool']*1000:8.1f}ms pool, "
+              f"base64 {row['b64decode']/row['decode_serial']:5.1%} of decode {row['b64encode']/row['encode_serial']:5.1%} of encode",
+              file=sys.stderr)
+    results['crossover'] = crossover
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Measure the import cost of the lazily generated ei module.
+#
+# Each mode runs in a fresh interpreter:
+#   lazy     import ei and touch nothing
+#   pipeline import ei and materialise the messages the periodicals job uses
+#   eager    import ei and materialise every class, i.e. the cost of the plain betterproto module
+#
+# Results depend on whether ei.py has a cached .pyc, e.g. PYTHONDONTWRITEBYTECODE
+# on a fresh checkout includes the cost of compiling the module.
+#
+# usage: python3 bench/ei_import.py [--repeat N]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PERIODICALS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# timing and memory are measured in separate runs since tracemalloc slows allocation down
+SNIPPET = '''
+import json, sys, time, tracemalloc
+import betterproto
+trace = sys.argv[1] == 'trace'
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+import ei
+{body}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "peak_bytes": tracemalloc.get_traced_memory()[1] if trace else 0,
+                  "classes": sum(1 for name in ei._FACTORIES if name in vars(ei))}}))
+'''
+
+MODES = {
+    'lazy': '',
+    'pipeline': '\n'.join(f'ei.{name}' for name in (
+        'PeriodicalsResponse', 'Contract', 'EggIncEvent', 'CustomEgg',
+        'ContractSeasonInfo', 'ContractSeasonInfos', 'AuthenticatedMessage', 'GetPeriodicalsRequest')),
+    'eager': 'ei.materialise_all()',
+}
+
+def run(body: str, trace: bool) -> dict:
+    out = subprocess.run([sys.executable, '-c', SNIPPET.format(body=body), 'trace' if trace else 'time'],
+                         cwd=PERIODICALS, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for mode, body in MODES.items():
+        runs = [run(body, False) for _ in range(args.repeat)]
+        traced = run(body, True)
+        results[mode] = {
+            'seconds': statistics.median(r['seconds'] for r in runs),
+            'peak_bytes': traced['peak_bytes'],
+            'classes': traced['classes'],
+        }
+        print(f"{mode:>8}: {results[mode]['seconds']*1000:7.1f}ms {results[mode]['peak_bytes']/1024:8.0f}KiB "
+              f"{results[mode]['classes']} classes", file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
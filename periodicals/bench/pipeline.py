@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Time every stage of the periodicals pipeline on synthetic archives.
+#
+# Archives are generated with bench/synthetic.py at each scale (1 is today's
+# size), then every stage runs in a fresh interpreter on a fresh copy of them,
+# once per repeat for timing and once more under tracemalloc for peak memory.
+# Setup such as loading inputs or priming the indexes is not measured.
+#
+#   decode             utils.decodeMany of every stored contract, serially
+#   encode             utils.encodeMany of the decoded contracts, serially
+#   getEvents          merge live events into the event archive
+#   updateEvents       getEvents and write events.json
+#   updateContracts    merge live contracts and write contracts.json, season files and indexes
+#   updateContracts-cold  the same without any index, i.e. a first run
+#   getContractSeasons merge live season infos into the season archive
+#
+# Results are printed as json, with the git revision, so runs of different
+# revisions can be compared with --compare.
+#
+# usage: python3 bench/pipeline.py [--scales 1,10,100] [--stages a,b] [--repeat N] [--output FILE]
+#        python3 bench/pipeline.py --compare BASE.json NEW.json
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PERIODICALS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PERIODICALS)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = ['decode', 'encode', 'getEvents', 'updateEvents', 'updateContracts', 'updateContracts-cold', 'getContractSeasons']
+
+# live data the merge stages get, taken from the end of the real archives
+LIVE_EVENTS = 10
+LIVE_CONTRACTS = 20
+LIVE_SEASONS = 3
+
+def liveEvents(now: float) -> list:
+    import ei
+    import defaults
+    import utils
+    events = list(utils.iterJsonArray(os.path.join(PERIODICALS, defaults.event_file)))[-LIVE_EVENTS:]
+    return [ei.EggIncEvent(
+        identifier = e['id'],
+        type       = e['type'],
+        multiplier = e['multiplier'],
+        subtitle   = e['message'],
+        start_time = now,
+        duration   = e['endTimestamp'] - e['startTimestamp'],
+        cc_only    = e['ultra']) for e in events]
+
+def liveContracts(now: float) -> list:
+    import ei
+    import defaults
+    import utils
+    stores = list(utils.iterJsonArray(os.path.join(PERIODICALS, defaults.contract_file)))[-LIVE_CONTRACTS:]
+    contracts = utils.decodeMany(ei.Contract, [store['proto'] for store in stores])
+    for contract in contracts:
+        contract.start_time = now - 86400
+        contract.expiration_time = now + 6 * 86400
+    return contracts
+
+def liveSeasons():
+    import ei
+    import defaults
+    import utils
+    stores = list(utils.iterJsonArray(os.path.join(PERIODICALS, defaults.contract_seasons_file)))[-LIVE_SEASONS:]
+    return ei.ContractSeasonInfos(infos=[utils.decode(ei.ContractSeasonInfo(), s['proto'], False) for s in stores])
+
+# set up a stage in the current directory and return the function to measure
+def prepare(stage: str):
+    import ei
+    import defaults
+    import utils
+    import updatePeriodicals as up
+    now = time.time()
+    if stage == 'decode':
+        protos = [store['proto'] for store in utils.iterJsonArray(defaults.contract_file)]
+        return lambda: utils.decodeMany(ei.Contract, protos, workers=1)
+    if stage == 'encode':
+        messages = utils.decodeMany(ei.Contract, [store['proto'] for store in utils.iterJsonArray(defaults.contract_file)])
+        return lambda: utils.encodeMany(messages, workers=1)
+    if stage == 'getEvents':
+        events = liveEvents(now)
+        return lambda: sum(1 for _ in up.getEvents(events, defaults.event_file))
+    if stage == 'updateEvents':
+        events = liveEvents(now)
+        return lambda: up.updateEvents(events, defaults.event_file)
+    if stage in ('updateContracts', 'updateContracts-cold'):
+        contracts = liveContracts(now)
+        if stage == 'updateContracts':
+            # prime the indexes and season files like a previous run would have
+            up.updateContracts(liveContracts(now), defaults.contract_file)
+        return lambda: up.updateContracts(contracts, defaults.contract_file)
+    if stage == 'getContractSeasons':
+        infos = liveSeasons()
+        return lambda: up.getContractSeasons(infos, defaults.contract_seasons_file)
+    raise ValueError(f"unknown stage {stage}")
+
+# child process: measure one stage in the current directory
+def measure(stage: str, trace: bool):
+    import contextlib
+    import io
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn = prepare(stage)
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+    print(json.dumps({ 'seconds': elapsed, 'peak_bytes': tracemalloc.get_traced_memory()[1] if trace else 0 }))
+
+def run(stage: str, archive: str, trace: bool) -> dict:
+    with tempfile.TemporaryDirectory() as work:
+        shutil.copytree(os.path.join(archive, 'data'), os.path.join(work, 'data'))
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--measure', stage] + (['--trace'] if trace else []),
+                             cwd=work, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PERIODICALS,
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+def compare(base_file: str, new_file: str):
+    with open(base_file, 'r', encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_file, 'r', encoding="utf-8") as f:
+        new = json.load(f)
+    print(f"{base.get('revision') or base_file} -> {new.get('revision') or new_file}")
+    for scale, stages in new['scales'].items():
+        for stage, result in stages.items():
+            before = base['scales'].get(scale, {}).get(stage)
+            if before is None:
+                continue
+            print(f"{scale:>4}x {stage:>22}: {before['seconds']*1000:9.1f}ms -> {result['seconds']*1000:9.1f}ms "
+                  f"({result['seconds']/before['seconds']:5.2f}x), peak {before['peak_bytes']/2**20:7.1f} -> "
+                  f"{result['peak_bytes']/2**20:7.1f}MiB")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', default='1,10,100')
+    parser.add_argument('--stages', default=','.join(STAGES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="also write the results to this file")
+    parser.add_argument('--workdir', help="keep the synthetic archives here between runs")
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'))
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        return measure(args.measure, args.trace)
+    if args.compare:
+        return compare(*args.compare)
+
+    import synthetic
+    workdir = args.workdir or tempfile.mkdtemp(prefix='periodicals-bench-')
+    results = {
+        'revision': revision(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'scales': {},
+    }
+    try:
+        for scale in map(int, args.scales.split(',')):
+            archive = os.path.join(workdir, f'x{scale}')
+            if not os.path.exists(os.path.join(archive, 'data')):
+                synthetic.generate(scale, archive)
+            results['scales'][str(scale)] = {}
+            for stage in args.stages.split(','):
+                runs = [run(stage, archive, False) for _ in range(args.repeat)]
+                traced = run(stage, archive, True)
+                result = { 'seconds': statistics.median(r['seconds'] for r in runs), 'peak_bytes': traced['peak_bytes'] }
+                results['scales'][str(scale)][stage] = result
+                print(f"{scale:>4}x {stage:>22}: {result['seconds']*1000:9.1f}ms {result['peak_bytes']/2**20:7.1f}MiB",
+                      file=sys.stderr)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# Build synthetic event, contract and contract season archives at a multiple of
+# today's size.
+#
+# Copy k of every real record is shifted back in time by k times the span of the
+# real archive and gets a "-x<k>" suffix on its id (and season id), so the
+# synthetic archive stays in chronological order, ids stay unique per copy and
+# every record is a realistic proto. Copy 0 is the real archive.
+#
+# usage: python3 bench/synthetic.py SCALE OUTDIR
+import argparse
+import json
+import os
+import shutil
+import sys
+
+PERIODICALS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PERIODICALS)
+import ei
+import defaults
+import output
+import utils
+
+def suffixed(id: str, k: int) -> str:
+    return f'{id}-x{k}' if k and id else id
+
+def span(times: list[float]) -> float:
+    times = [t for t in times if t > 0]
+    return (max(times) - min(times) + 86400) if times else 86400
+
+def events(records: list[dict], scale: int) -> list[dict]:
+    shift = span([e['startTimestamp'] for e in records])
+    out = []
+    for k in reversed(range(scale)):
+        for event in records:
+            event = dict(event)
+            event['id'] = suffixed(event['id'], k)
+            event['startTimestamp'] -= k * shift
+            event['endTimestamp'] -= k * shift
+            out.append(event)
+    return out
+
+def contracts(stores: list[dict], scale: int) -> list[dict]:
+    decoded = utils.decodeMany(ei.Contract, [store['proto'] for store in stores])
+    shift = span([c.start_time for c in decoded] + [c.expiration_time for c in decoded])
+    out = []
+    for k in reversed(range(scale)):
+        if k == 0:
+            out += stores
+            continue
+        copies = []
+        for contract in decoded:
+            contract = ei.Contract().parse(bytes(contract))
+            contract.identifier = suffixed(contract.identifier, k)
+            contract.season_id = suffixed(contract.season_id, k)
+            if contract.start_time:
+                contract.start_time -= k * shift
+            contract.expiration_time -= k * shift
+            copies.append(contract)
+        out += [{ 'id': c.identifier, 'proto': proto } for c, proto in zip(copies, utils.encodeMany(copies))]
+    return out
+
+def seasons(stores: list[dict], scale: int) -> list[dict]:
+    decoded = [utils.decode(ei.ContractSeasonInfo(), store['proto'], False) for store in stores]
+    shift = span([s.start_time for s in decoded])
+    out = []
+    for k in reversed(range(scale)):
+        for season in decoded:
+            season = ei.ContractSeasonInfo().parse(bytes(season))
+            season.id = suffixed(season.id, k)
+            if season.start_time:
+                season.start_time -= k * shift
+            out.append({ 'id': season.id, 'proto': utils.encode(season) })
+    return out
+
+# write a data/ directory with the synthetic archives under outdir
+def generate(scale: int, outdir: str, source: str = PERIODICALS):
+    data = os.path.join(outdir, 'data')
+    os.makedirs(data, exist_ok=True)
+
+    def load(file: str) -> list:
+        return list(utils.iterJsonArray(os.path.join(source, file)))
+
+    output.writeJsonRecords(events(load(defaults.event_file), scale), os.path.join(outdir, defaults.event_file))
+    output.writeJsonRecords(contracts(load(defaults.contract_file), scale), os.path.join(outdir, defaults.contract_file))
+    output.writeJsonRecords(seasons(load(defaults.contract_seasons_file), scale),
+                            os.path.join(outdir, defaults.contract_seasons_file))
+    shutil.copy(os.path.join(source, defaults.egg_file), os.path.join(outdir, defaults.egg_file))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('scale', type=int)
+    parser.add_argument('outdir')
+    args = parser.parse_args()
+    generate(args.scale, args.outdir)
+    for file in (defaults.event_file, defaults.contract_file, defaults.contract_seasons_file):
+        path = os.path.join(args.outdir, file)
+        with open(path, 'r', encoding="utf-8") as f:
+            print(f"{path}: {len(json.load(f))} records, {os.path.getsize(path)} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# Compact binary copy of contracts.json.
+#
+# data/contracts.bin holds the raw Contract protos back to back followed by a fixed
+# size index, so a reader can mmap it, binary search it by id or start time, or range
+# fetch a single contract, without parsing json or base64. All integers are little
+# endian.
+#
+#   header   magic b'EICA', u32 version, u32 record count, u32 id bytes, u64 index offset
+#   data     the Contract protos, then zero padding to a multiple of 8 bytes
+#   records  at the index offset, per contract in contracts.json order:
+#            f64 start_time, f64 expiration_time, u32 proto offset, u32 proto length,
+#            u32 id offset, u32 id length
+#            (proto offsets are relative to the end of the header, id offsets to the id bytes)
+#   by id    u32 record numbers ordered by (id, start_time, record number)
+#   by start u32 record numbers ordered by (start_time, record number)
+#   ids      utf-8 contract ids
+#
+# The protos are written as the archive streams in and the header is filled in last,
+# so only the index rows are held in memory. The file is built by the updater and in
+# CI but not committed, as every contract change would rewrite all of it.
+#
+# usage:
+#   binarchive.py build                  write data/contracts.bin from data/contracts.json
+#   binarchive.py get ID                 print the stored versions of a contract as json
+import base64
+import bisect
+import mmap
+import struct
+import sys
+from typing import Iterable, Iterator, Optional
+# local imports
+import ei
+import defaults
+import output
+import utils
+
+MAGIC = b'EICA'
+VERSION = 2
+HEADER = struct.Struct('<4sIIIQ')
+RECORD = struct.Struct('<ddIIII')
+ORDER = struct.Struct('<I')
+
+# write the { id, proto: b64 contract } stores, only touching file when the content changed
+def write(stores: Iterable[dict], file: str) -> bool:
+    records = []
+    ids = bytearray()
+    size = 0
+    out = output.OutputFile(file)
+    with out as f:
+        # counts and offsets aren't known yet, the header is patched at the end
+        f.write(bytes(HEADER.size))
+        for store in stores:
+            proto = base64.b64decode(store['proto'])
+            fields = utils.scanFields(ei.Contract, proto, ('start_time', 'expiration_time'))
+            id = store['id'].encode('utf-8')
+            records.append((fields['start_time'], fields['expiration_time'], size, len(proto), len(ids), len(id)))
+            ids += id
+            size += len(proto)
+            f.write(proto)
+        f.write(bytes(-size % 8))
+        index_offset = HEADER.size + size + -size % 8
+
+        def idBytes(i: int) -> bytes:
+            return bytes(ids[records[i][4]:records[i][4] + records[i][5]])
+
+        by_id = sorted(range(len(records)), key=lambda i: (idBytes(i), records[i][0], i))
+        by_start = sorted(range(len(records)), key=lambda i: (records[i][0], i))
+        f.write(b''.join(RECORD.pack(*record) for record in records))
+        f.write(b''.join(ORDER.pack(i) for i in by_id))
+        f.write(b''.join(ORDER.pack(i) for i in by_start))
+        f.write(bytes(ids))
+        f.patch(0, HEADER.pack(MAGIC, VERSION, len(records), len(ids), index_offset))
+    return out.replaced
+
+class BinaryArchive:
+    def __init__(self, buf):
+        self.buf = memoryview(buf)
+        magic, version, self.count, ids_size, self.index_offset = HEADER.unpack_from(self.buf)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} contract archive")
+        self.data_offset = HEADER.size
+        self.by_id_offset = self.index_offset + self.count * RECORD.size
+        self.by_start_offset = self.by_id_offset + self.count * ORDER.size
+        self.ids_offset = self.by_start_offset + self.count * ORDER.size
+
+    # map the file read only, close() releases it
+    @classmethod
+    def open(cls, file: str) -> "BinaryArchive":
+        with open(file, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        archive = cls(mapped)
+        archive.mapped = mapped
+        return archive
+
+    def close(self):
+        self.buf.release()
+        if hasattr(self, 'mapped'):
+            self.mapped.close()
+
+    def __enter__(self) -> "BinaryArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    # (start_time, expiration_time, proto offset, proto length, id offset, id length) of record i
+    def record(self, i: int) -> tuple[float, float, int, int, int, int]:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return RECORD.unpack_from(self.buf, self.index_offset + i * RECORD.size)
+
+    def _idBytes(self, i: int) -> memoryview:
+        _, _, _, _, offset, length = self.record(i)
+        return self.buf[self.ids_offset + offset:self.ids_offset + offset + length]
+
+    def id(self, i: int) -> str:
+        return str(self._idBytes(i), 'utf-8')
+
+    def startTime(self, i: int) -> float:
+        return self.record(i)[0]
+
+    # raw Contract bytes of record i, copied out so they outlive close()
+    def proto(self, i: int) -> bytes:
+        _, _, offset, length, _, _ = self.record(i)
+        return bytes(self.buf[self.data_offset + offset:self.data_offset + offset + length])
+
+    def contract(self, i: int) -> "ei.Contract":
+        return ei.Contract().parse(self.proto(i))
+
+    def _byId(self, n: int) -> int:
+        return ORDER.unpack_from(self.buf, self.by_id_offset + n * ORDER.size)[0]
+
+    def _byStart(self, n: int) -> int:
+        return ORDER.unpack_from(self.buf, self.by_start_offset + n * ORDER.size)[0]
+
+    # record numbers of every stored version of a contract, oldest first
+    def find(self, id: str) -> list[int]:
+        key = id.encode('utf-8')
+        n = bisect.bisect_left(range(self.count), key, key=lambda n: bytes(self._idBytes(self._byId(n))))
+        found = []
+        while n < self.count and self._idBytes(self._byId(n)) == key:
+            found.append(self._byId(n))
+            n += 1
+        return found
+
+    # record numbers of the contracts starting in [start, end), by start time
+    def between(self, start: float, end: Optional[float] = None) -> list[int]:
+        lo = bisect.bisect_left(range(self.count), start, key=lambda n: self.startTime(self._byStart(n)))
+        hi = self.count if end is None else \
+            bisect.bisect_left(range(self.count), end, key=lambda n: self.startTime(self._byStart(n)))
+        return [self._byStart(n) for n in range(lo, hi)]
+
+    # the archive back in { id, proto: b64 contract } form, in contracts.json order
+    def stores(self) -> Iterator[dict]:
+        for i in range(self.count):
+            yield { 'id': self.id(i), 'proto': base64.b64encode(self.proto(i)).decode('utf-8') }
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('build', 'get') or (sys.argv[1] == 'get' and len(sys.argv) < 3):
+        sys.exit(f"usage: {sys.argv[0]} build | get ID")
+    if sys.argv[1] == 'build':
+        write(utils.iterJsonArray(defaults.contract_file), defaults.contract_binary_file)
+        output.reportChanged()
+        return
+    with BinaryArchive.open(defaults.contract_binary_file) as archive:
+        for i in archive.find(sys.argv[2]):
+            print(archive.contract(i).to_json(indent=2))
+
+if __name__ == "__main__":
+    main()
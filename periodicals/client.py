@@ -0,0 +1,144 @@
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import urljoin, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+# local imports
+import defaults
+import instrument
+
+# status codes worth another attempt, everything else is returned to the caller
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    def observe(self, latency: float):
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+# file a response for an endpoint path is recorded to and replayed from,
+# e.g. /ei/get_periodicals -> ei_get_periodicals.bin
+def fixtureName(path: str) -> str:
+    return path.strip('/').replace('/', '_') + '.bin'
+
+# shared http client for the auxbrain endpoints and asset downloads
+# keeps one pooled keep-alive session, applies timeouts to every request and
+# retries transient failures with bounded exponential backoff and full jitter
+# with record_dir set, the body of every successful response is saved there for standin.py
+class Client:
+    def __init__(self,
+                 base_url: str = defaults.base_url,
+                 connect_timeout: float = 5,
+                 read_timeout: float = 30,
+                 retries: int = 4,
+                 backoff: float = 0.5,
+                 max_backoff: float = 8,
+                 pool_size: int = 16,
+                 record_dir: Optional[str] = defaults.record_dir):
+        self.base_url = base_url
+        self.record_dir = record_dir
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats: dict[str, EndpointStats] = {}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    # relative urls are resolved against base_url, absolute ones are used as is
+    def resolve(self, url: str) -> str:
+        return urljoin(self.base_url.rstrip('/') + '/', url.lstrip('/')) if not urlparse(url).scheme else url
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        url = self.resolve(url)
+        path = urlparse(url).path
+        stats = self.stats.setdefault(path, EndpointStats())
+        kwargs.setdefault('timeout', self.timeout)
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                with instrument.span(f'http {method} {path}'):
+                    response = self.session.request(method, url, **kwargs)
+                    if not kwargs.get('stream'):
+                        instrument.count('bytes fetched', len(response.content))
+            except (requests.ConnectionError, requests.Timeout):
+                stats.observe(time.perf_counter() - start)
+                if attempt >= self.retries:
+                    stats.failures += 1
+                    raise
+            else:
+                stats.observe(time.perf_counter() - start)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    if not response.ok:
+                        stats.failures += 1
+                    elif self.record_dir and not kwargs.get('stream'):
+                        self.record(urlparse(url).path, response.content)
+                    return response
+                response.close()
+            stats.retries += 1
+            time.sleep(self.delay(attempt))
+            attempt += 1
+
+    def record(self, path: str, content: bytes):
+        os.makedirs(self.record_dir, exist_ok=True)
+        with open(os.path.join(self.record_dir, fixtureName(path)), 'wb') as f:
+            f.write(content)
+
+    # post and yield the response body in chunks as it arrives, recording it like
+    # any other response. Failures while reading the body are not retried, and an
+    # error status left after the retries raises instead of yielding the error body.
+    def postStream(self, url: str, chunk_size: int = 64 * 1024, **kwargs) -> Iterator[bytes]:
+        with self.post(url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            record = None
+            if self.record_dir:
+                os.makedirs(self.record_dir, exist_ok=True)
+                record = open(os.path.join(self.record_dir, fixtureName(urlparse(response.url).path)), 'wb')
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    instrument.count('bytes fetched', len(chunk))
+                    if record is not None:
+                        record.write(chunk)
+                    yield chunk
+            finally:
+                if record is not None:
+                    record.close()
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def report(self):
+        for endpoint, s in sorted(self.stats.items()):
+            mean = s.total_latency / s.requests if s.requests else 0
+            print(f"{endpoint}: {s.requests} requests, {s.retries} retries, {s.failures} failures, "
+                  f"{mean*1000:.0f}ms mean, {s.max_latency*1000:.0f}ms max")
+
+_client: Optional[Client] = None
+
+# process-wide client so every caller shares the same connection pool
+def getClient() -> Client:
+    global _client
+    if _client is None:
+        _client = Client()
+    return _client
@@ -0,0 +1,79 @@
+import json
+import os
+from typing import Iterable
+# local imports
+import ei
+import output
+import utils
+from archive import ContractArchive
+
+# custom egg id -> ids of the contracts using that egg
+# kept up to date as contracts are merged so colleggtible-contracts.json never needs
+# a decode pass over the whole archive
+class CustomEggIndex:
+    def __init__(self, file: str, index: dict):
+        self.file = file
+        # digest of the contracts.json the index was built from
+        self.source: str = index.get('source', '')
+        self.contracts: dict[str, list[str]] = index.get('contracts', {})
+
+    @classmethod
+    def load(cls, file: str) -> "CustomEggIndex":
+        index = {}
+        if os.path.exists(file):
+            with open(file, 'r', encoding="utf-8") as f:
+                index = json.load(f)
+        return cls(file, index)
+
+    # whether the index was built from the given archive, e.g. not before the go updater rewrote it
+    def matches(self, contract_file: str) -> bool:
+        return bool(self.source) and self.source == output.fileDigest(contract_file)
+
+    def add(self, entry: dict):
+        if not entry['custom_egg_id'] or not entry['id']:
+            return
+        ids = self.contracts.setdefault(entry['custom_egg_id'], [])
+        if entry['id'] not in ids:
+            ids.append(entry['id'])
+            ids.sort()
+
+    def rebuild(self, stores: Iterable[dict], archive: ContractArchive):
+        self.contracts = {}
+        for store in stores:
+            self.add(archive.entry(store))
+
+    def save(self, contract_file: str):
+        self.source = output.fileDigest(contract_file) or ''
+        output.writeJson({ 'source': self.source, 'contracts': self.contracts }, self.file)
+
+    # ids of the contracts using any of the given custom eggs
+    def contractIds(self, custom_egg_ids: Iterable[str]) -> set[str]:
+        return {id for egg_id in custom_egg_ids for id in self.contracts.get(egg_id, [])}
+
+# identifiers of the custom eggs in a json array of b64 CustomEgg protos
+def customEggIds(egg_file: str) -> set[str]:
+    ids = set()
+    for proto in utils.iterJsonArray(egg_file):
+        try:
+            egg = utils.decode(ei.CustomEgg(), proto, False)
+        except Exception:
+            continue
+        if egg.identifier:
+            ids.add(egg.identifier)
+    return ids
+
+# contracts.json-shaped list of the contracts using a custom egg from egg_file, first
+# stored version of each contract, sorted by id like the go updater
+def colleggtibleContracts(archive: ContractArchive, index: CustomEggIndex, egg_file: str) -> list[dict]:
+    known = customEggIds(egg_file)
+    wanted = index.contractIds(known)
+    seen = set()
+    stores = []
+    for store in archive.stores():
+        if store['id'] not in wanted or store['id'] in seen:
+            continue
+        if archive.entry(store)['custom_egg_id'] not in known:
+            continue
+        seen.add(store['id'])
+        stores.append(store)
+    return sorted(stores, key=lambda x: x['id'])
@@ -7,13 +7,39 @@ version = '1.33.1'
 build = '111291'
 platform = "IOS"
 event_file = "data/events.json"
+# events.json split by quarter or year, see eventshards.py
+event_shards_dir = "data/events"
+event_shard_period = "quarter"
+# per event type, multiplier and ultra counts, gaps and start times, see eventstats.py
+event_stats_file = "data/eventstats.json"
 contract_file = "data/contracts.json"
+contract_index_file = "data/contracts.index.json"
+# contracts.json as raw protos behind an id and start time index, see binarchive.py, not committed
+contract_binary_file = "data/contracts.bin"
 egg_file = "data/customeggs.json"
 contract_seasons_file = "data/contractseasons.json"
+contract_seasons_index_file = "data/contractseasons.index.json"
+# contracts of the current season, and of every season under seasons_dir
+season_contract_file = "data/seasoncontracts.json"
+seasons_dir = "data/seasons"
+# contracts with a custom egg from egg_file, and the custom egg id -> contract ids index behind it
+colleggtible_contracts_file = "data/colleggtible-contracts.json"
+colleggtible_index_file = "data/colleggtible-contracts.index.json"
+# digests of the api data each subcommand last ran on
+digest_file = "data/periodicals.digests.json"
+# sqlite archive used with --store, not committed
+store_file = "data/archive.sqlite"
 # Get egg id from environment variable
 user_id = os.environ.get('EI_USERID') or ""
-url = 'https://www.auxbrain.com/ei/get_periodicals'
-season_info_url = 'https://www.auxbrain.com/ei_ctx/get_season_infos_v2'
+# point at a local stand-in server by setting EI_BASE_URL
+base_url = os.environ.get('EI_BASE_URL') or 'https://www.auxbrain.com'
+url = f'{base_url}/ei/get_periodicals'
+season_info_url = f'{base_url}/ei_ctx/get_season_infos_v2'
+# save raw api responses here for replay with standin.py
+record_dir = os.environ.get('EI_RECORD_DIR') or None
+fixtures_dir = "fixtures"
+# chrome trace written by updatePeriodicals.py --profile
+profile_file = "profile.trace.json"
 
 def rinfo() -> "ei.BasicRequestInfo":
   return ei.BasicRequestInfo(
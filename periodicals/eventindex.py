@@ -0,0 +1,56 @@
+from collections import defaultdict
+from typing import Iterable, Iterator, Optional
+
+# Events are considered the same if they have the same id and start within 2 days of each other
+SAME_EVENT_WINDOW = 2*86400
+
+# index of events keyed by id and bucketed by startTimestamp
+# buckets are SAME_EVENT_WINDOW wide, so any event that can match a given start
+# time lives in that start time's bucket or one of its two neighbours
+class EventIndex:
+    def __init__(self, events: Iterable[dict] = ()):
+        self._index: dict[str, dict[int, list[dict]]] = defaultdict(lambda: defaultdict(list))
+        self._size = 0
+        for event in events:
+            self.add(event)
+
+    @staticmethod
+    def bucket(timestamp: float) -> int:
+        return int(timestamp // SAME_EVENT_WINDOW)
+
+    def add(self, event: dict):
+        self._index[event['id']][self.bucket(event['startTimestamp'])].append(event)
+        self._size += 1
+
+    # return the stored event that is the same event as the given one, if any
+    def find(self, event: dict) -> Optional[dict]:
+        buckets = self._index.get(event['id'])
+        if not buckets:
+            return None
+        start = event['startTimestamp']
+        b = self.bucket(start)
+        for neighbour in (b - 1, b, b + 1):
+            for e in buckets.get(neighbour, ()):
+                if abs(start - e['startTimestamp']) < SAME_EVENT_WINDOW:
+                    return e
+        return None
+
+    # stored events whose [startTimestamp, endTimestamp) overlaps the given event's
+    # and share its id, regardless of how far apart they started
+    def overlapping(self, event: dict) -> list[dict]:
+        buckets = self._index.get(event['id'])
+        if not buckets:
+            return []
+        return [e for bucket in buckets.values() for e in bucket
+                if e['startTimestamp'] < event['endTimestamp'] and event['startTimestamp'] < e['endTimestamp']]
+
+    def __contains__(self, event: dict) -> bool:
+        return self.find(event) is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[dict]:
+        for buckets in self._index.values():
+            for bucket in buckets.values():
+                yield from bucket
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# events.json split by time, for clients that only need a range of it.
+#
+# data/events/<shard>.json holds the events starting in one quarter (2024-Q3.json) or
+# year (2024.json), in events.json order and format. data/events/index.json lists the
+# shards with the time range they cover, the span of their events (an event can run
+# past the end of its shard), their event count and the sha256 of the shard file, so
+# a client can pick the shards overlapping the range it needs and cache them by hash.
+#
+# A shard is only rewritten when its content hash differs from the manifest, which
+# normally means just the latest one.
+#
+# usage:
+#   eventshards.py rebuild [--period quarter|year]   shard data/events.json from scratch
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Iterable
+# local imports
+import defaults
+import output
+import utils
+
+PERIODS = ('quarter', 'year')
+
+# shard id and [start, end) unix time range of the shard a timestamp falls in
+def shardOf(timestamp: float, period: str) -> tuple[str, int, int]:
+    t = datetime.fromtimestamp(timestamp, timezone.utc)
+    if period == 'year':
+        return (f'{t.year}', int(datetime(t.year, 1, 1, tzinfo=timezone.utc).timestamp()),
+                int(datetime(t.year + 1, 1, 1, tzinfo=timezone.utc).timestamp()))
+    quarter = (t.month - 1) // 3
+    start = datetime(t.year, quarter * 3 + 1, 1, tzinfo=timezone.utc)
+    end = datetime(t.year + 1, 1, 1, tzinfo=timezone.utc) if quarter == 3 else \
+        datetime(t.year, quarter * 3 + 4, 1, tzinfo=timezone.utc)
+    return f'{t.year}-Q{quarter + 1}', int(start.timestamp()), int(end.timestamp())
+
+def loadManifest(directory: str) -> dict:
+    index_file = os.path.join(directory, 'index.json')
+    if not os.path.exists(index_file):
+        return {}
+    with open(index_file, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
+# shard the events, rewriting only the shards whose content changed
+# force: compare every shard with the file on disk instead of trusting the manifest's hashes
+def write(events: Iterable[dict], directory: str = defaults.event_shards_dir, period: str = defaults.event_shard_period,
+          force: bool = False):
+    if period not in PERIODS:
+        raise ValueError(f"unknown shard period {period}")
+    os.makedirs(directory, exist_ok=True)
+    manifest = loadManifest(directory)
+    known = { shard['id']: shard for shard in manifest.get('shards', []) } \
+        if manifest.get('period') == period and not force else {}
+
+    shards: dict[str, dict] = {}
+    grouped: dict[str, list[dict]] = {}
+    for event in events:
+        id, start, end = shardOf(event['startTimestamp'], period)
+        if id not in shards:
+            shards[id] = { 'id': id, 'file': f'{id}.json', 'start': start, 'end': end,
+                           'first_start': event['startTimestamp'], 'last_end': event['endTimestamp'] }
+            grouped[id] = []
+        shard = shards[id]
+        shard['first_start'] = min(shard['first_start'], event['startTimestamp'])
+        shard['last_end'] = max(shard['last_end'], event['endTimestamp'])
+        grouped[id].append(event)
+
+    for id, shard in shards.items():
+        text = ''.join(output.jsonRecords(grouped[id])) + '\n'
+        shard['count'] = len(grouped[id])
+        shard['sha256'] = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        path = os.path.join(directory, shard['file'])
+        if known.get(id, {}).get('sha256') != shard['sha256'] or not os.path.exists(path):
+            out = output.OutputFile(path)
+            with out as f:
+                f.write(text)
+
+    # drop shards that no longer have events, e.g. after switching periods
+    for shard in manifest.get('shards', []):
+        if shard['id'] not in shards and os.path.exists(os.path.join(directory, shard['file'])):
+            os.remove(os.path.join(directory, shard['file']))
+            output.changed.append(os.path.join(directory, shard['file']))
+
+    output.writeJson({ 'period': period, 'shards': sorted(shards.values(), key=lambda s: s['start']) },
+                     os.path.join(directory, 'index.json'))
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] != 'rebuild':
+        sys.exit(f"usage: {sys.argv[0]} rebuild [--period {'|'.join(PERIODS)}]")
+    period = args[args.index('--period') + 1] if '--period' in args else defaults.event_shard_period
+    write(utils.iterJsonArray(defaults.event_file), defaults.event_shards_dir, period, force=True)
+    output.reportChanged()
+
+if __name__ == "__main__":
+    main()
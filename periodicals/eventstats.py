@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# Precomputed event statistics, so clients don't scan the whole event list for
+# things like "when did the last 3x research sale run".
+#
+# data/eventstats.json has one group per (type, multiplier, ultra) with
+#   count       number of events
+#   last_start  start of the latest event that had started when the file was built
+#   next_start  start of the earliest event known to start after that, or null
+#   gaps        histogram of the days between consecutive starts, { whole days: count }
+#   starts      start times in order, and ends the matching end times
+#
+# A build matches the events against the (start, end) pairs it already counted and
+# only folds in the new ones. Counted events missing from the archive are taken out
+# again, which is how a stored event the api replaced with a later version of the
+# same event (see eventindex.SAME_EVENT_WINDOW) leaves the stats, however old it is.
+#
+# usage:
+#   eventstats.py rebuild      regenerate data/eventstats.json from data/events.json
+#   eventstats.py check        exit 1 if data/eventstats.json differs from a rebuild
+import bisect
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Iterable, Optional
+# local imports
+import defaults
+import output
+import utils
+
+DAY = 86400
+
+class EventGroup:
+    def __init__(self, group: dict):
+        self.starts: list[float] = group.get('starts', [])
+        self.ends: list[float] = group.get('ends', [])
+        self.gaps: dict[str, int] = group.get('gaps', {})
+
+    def _gap(self, a: float, b: float, n: int):
+        key = str(int((b - a) // DAY))
+        self.gaps[key] = self.gaps.get(key, 0) + n
+        if not self.gaps[key]:
+            del self.gaps[key]
+
+    # events starting together are kept ordered by end, so the order doesn't depend on
+    # which build added them
+    def add(self, start: float, end: float):
+        i = bisect.bisect_right(self.starts, start)
+        while i > 0 and self.starts[i - 1] == start and self.ends[i - 1] > end:
+            i -= 1
+        if 0 < i < len(self.starts):
+            self._gap(self.starts[i - 1], self.starts[i], -1)
+        if i > 0:
+            self._gap(self.starts[i - 1], start, 1)
+        if i < len(self.starts):
+            self._gap(start, self.starts[i], 1)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+    def remove(self, start: float, end: float):
+        i = bisect.bisect_left(self.starts, start)
+        while self.ends[i] != end:
+            i += 1
+        if i > 0:
+            self._gap(self.starts[i - 1], start, -1)
+        if i + 1 < len(self.starts):
+            self._gap(start, self.starts[i + 1], -1)
+        if 0 < i < len(self.starts) - 1:
+            self._gap(self.starts[i - 1], self.starts[i + 1], 1)
+        del self.starts[i], self.ends[i]
+
+    def toJson(self, type: str, multiplier: float, ultra: bool, now: float) -> dict:
+        i = bisect.bisect_right(self.starts, now)
+        return {
+            'type': type,
+            'multiplier': multiplier,
+            'ultra': ultra,
+            'count': len(self.starts),
+            'last_start': self.starts[i - 1] if i > 0 else None,
+            'next_start': self.starts[i] if i < len(self.starts) else None,
+            'gaps': dict(sorted(self.gaps.items(), key=lambda x: int(x[0]))),
+            'starts': self.starts,
+            'ends': self.ends,
+        }
+
+class EventStats:
+    def __init__(self, stats: dict):
+        # latest start folded in so far
+        self.through: float = stats.get('through', 0)
+        self.groups: dict[tuple, EventGroup] = {
+            (g['type'], g['multiplier'], g['ultra']): EventGroup(g) for g in stats.get('groups', []) }
+
+    @classmethod
+    def load(cls, file: str = defaults.event_stats_file) -> "EventStats":
+        stats = {}
+        if os.path.exists(file):
+            with open(file, 'r', encoding="utf-8") as f:
+                stats = json.load(f)
+        return cls(stats)
+
+    # fold in the events the last build didn't count and drop the counted ones that are no
+    # longer in events
+    def update(self, events: Iterable[dict]):
+        counted = Counter((key, start, end) for key, group in self.groups.items()
+                          for start, end in zip(group.starts, group.ends))
+        added = []
+        for event in events:
+            entry = ((event['type'], event['multiplier'], event['ultra']), event['startTimestamp'], event['endTimestamp'])
+            if counted[entry] > 0:
+                counted[entry] -= 1
+            else:
+                added.append(entry)
+        for (key, start, end), n in counted.items():
+            for _ in range(n):
+                self.groups[key].remove(start, end)
+        for key, start, end in added:
+            self.groups.setdefault(key, EventGroup({})).add(start, end)
+        self.groups = { key: group for key, group in self.groups.items() if group.starts }
+        self.through = max((group.starts[-1] for group in self.groups.values()), default=0)
+
+    def toJson(self, now: Optional[float] = None) -> dict:
+        now = time.time() if now is None else now
+        groups = [group.toJson(*key, now) for key, group in sorted(self.groups.items(), key=lambda x: x[0])]
+        return { 'through': self.through, 'groups': groups }
+
+    def save(self, file: str = defaults.event_stats_file, now: Optional[float] = None):
+        output.writeJson(self.toJson(now), file, indent=None, separators=(',', ':'))
+
+def update(events: Iterable[dict], file: str = defaults.event_stats_file, now: Optional[float] = None):
+    stats = EventStats.load(file)
+    stats.update(events)
+    stats.save(file, now)
+
+def main():
+    if sys.argv[1:] not in (['rebuild'], ['check']):
+        sys.exit(f"usage: {sys.argv[0]} rebuild | check")
+    stats = EventStats({})
+    stats.update(utils.iterJsonArray(defaults.event_file))
+    if sys.argv[1] == 'check':
+        # both sides are serialised at the same time, so last_start and next_start agree too
+        now = time.time()
+        if EventStats.load(defaults.event_stats_file).toJson(now) != stats.toJson(now):
+            sys.exit(f"{defaults.event_stats_file} differs from a rebuild of {defaults.event_file}")
+        print(f"{defaults.event_stats_file} matches a rebuild")
+        return
+    stats.save(defaults.event_stats_file)
+    output.reportChanged()
+
+if __name__ == "__main__":
+    main()
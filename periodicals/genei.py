@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# Post-process the python-betterproto output for ei.proto into the ei.py we import.
+#
+# The plain betterproto module builds every message class at import time, which
+# is most of the cost of importing ei even though the periodicals job only needs
+# a handful of them. The generated module wraps each class in a factory function,
+# which is compiled into the .pyc like any other code object but only run on
+# first attribute access, together with the factories of every class its fields
+# refer to so betterproto can still resolve the type hints.
+#
+# Messages named with --slots are emitted as @dataclass(slots=True) subclasses of
+# hotproto.HotMessage, which parses and serialises through per-class field tables
+# instead of betterproto's generic reflection. Use it for the messages decoded in
+# bulk, e.g. the contract archive.
+#
+# usage: genei.py [--slots Name,Name,...] <betterproto ei.py> <output ei.py>
+import argparse
+import ast
+
+HEADER = '''\
+# Generated by genei.py from the python-betterproto output for ei.proto.  DO NOT EDIT!
+# sources: ei.proto
+# plugin: python-betterproto
+#
+# Message and enum classes are built lazily on first access through the
+# module __getattr__, along with every class they reference.
+import threading
+from dataclasses import dataclass
+from typing import List
+
+import betterproto
+'''
+
+FOOTER = '''
+_lock = threading.RLock()
+
+
+def _materialise(name: str):
+    with _lock:
+        # define everything reachable from name so betterproto can resolve the type hints
+        pending = [name]
+        seen = {name}
+        while pending:
+            current = pending.pop()
+            for dep in _DEPS[current]:
+                if dep not in seen:
+                    seen.add(dep)
+                    pending.append(dep)
+        # build every class before publishing any, so other threads never see
+        # a class before the classes it refers to
+        g = globals()
+        built = {}
+        for dep in sorted(seen):
+            if dep not in g:
+                cls = _FACTORIES[dep]()
+                cls.__qualname__ = dep
+                built[dep] = cls
+        g.update(built)
+        return g[name]
+
+
+def __getattr__(name: str):
+    if name in _FACTORIES:
+        return _materialise(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_FACTORIES))
+
+
+# build every class, e.g. to measure the eager import cost
+def materialise_all():
+    for name in _FACTORIES:
+        _materialise(name)
+'''
+
+# names of other top level classes referenced in a class's annotations
+def dependencies(node: ast.ClassDef, classes: set[str]) -> list[str]:
+    deps = []
+    for stmt in node.body:
+        if not isinstance(stmt, ast.AnnAssign):
+            continue
+        for sub in ast.walk(stmt.annotation):
+            name = None
+            if isinstance(sub, ast.Name):
+                name = sub.id
+            elif isinstance(sub, ast.Constant) and isinstance(sub.value, str):
+                name = sub.value
+            if name in classes and name != node.name and name not in deps:
+                deps.append(name)
+    return deps
+
+# turn a plain betterproto message class into a slotted hot message
+def slotted(source: str, name: str) -> str:
+    decorator = "@dataclass\n"
+    base = f"class {name}(betterproto.Message):"
+    if not source.startswith(decorator) or base not in source:
+        raise ValueError(f"{name} is not a betterproto message class")
+    return "@dataclass(slots=True)\n" + source[len(decorator):].replace(base, f"class {name}(hotproto.HotMessage):", 1)
+
+def generate(source: str, hot: frozenset[str] = frozenset()) -> str:
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    names = {node.name for node in classes}
+    if hot - names:
+        raise ValueError(f"unknown messages for --slots: {', '.join(sorted(hot - names))}")
+
+    out = [HEADER, "import hotproto\n" if hot else "", "\n"]
+    for node in classes:
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1
+        text = ''.join(lines[start:node.end_lineno])
+        if node.name in hot:
+            text = slotted(text, node.name)
+        body = ''.join('    ' + line if line.strip() else line for line in text.splitlines(keepends=True))
+        out.append(f"\ndef _{node.name}():\n{body}    return {node.name}\n\n")
+    out.append("\n_FACTORIES = {\n")
+    for node in classes:
+        out.append(f"    {node.name!r}: _{node.name},\n")
+    out.append("}\n\n_DEPS = {\n")
+    for node in classes:
+        out.append(f"    {node.name!r}: {tuple(dependencies(node, names))!r},\n")
+    out.append("}\n")
+    out.append(FOOTER)
+    return "".join(out)
+
+def main():
+    parser = argparse.ArgumentParser(description="Post-process the betterproto output for ei.proto")
+    parser.add_argument('--slots', default='', help="comma separated messages to emit as slotted hot messages")
+    parser.add_argument('source')
+    parser.add_argument('output')
+    args = parser.parse_args()
+
+    hot = frozenset(name for name in args.slots.split(',') if name)
+    with open(args.source, 'r', encoding="utf-8") as f:
+        source = f.read()
+    generated = generate(source, hot)
+    with open(args.output, 'w', encoding="utf-8") as f:
+        f.write(generated)
+
+if __name__ == "__main__":
+    main()
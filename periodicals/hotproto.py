@@ -0,0 +1,290 @@
+import dataclasses
+import struct
+from typing import Any, Callable, Optional
+import betterproto
+from betterproto import PLACEHOLDER, FieldMetadata, encode_varint
+
+# Base class for the hot message classes genei.py emits with --slots.
+#
+# The generated classes are @dataclass(slots=True) subclasses of this, so field
+# values live in slots, and parse()/__bytes__ are driven by per-class field
+# tables built once on first use instead of betterproto's per-call reflection
+# over dataclasses.fields() and type hints. The wire output and parse results
+# are the same as betterproto.Message's, including unknown field passthrough.
+
+def _decodeVarint(data: bytes, pos: int) -> tuple[int, int]:
+    b = data[pos]
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        b = data[pos]
+        result |= (b & 0x7F) << shift
+        pos += 1
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Too many bytes when decoding varint.")
+
+def _signed(bits: int) -> Callable[[int], int]:
+    mask = (1 << bits) - 1
+    signbit = 1 << (bits - 1)
+    return lambda v: ((v & mask) ^ signbit) - signbit
+
+def _zigzag(v: int) -> int:
+    return (v >> 1) ^ (-(v & 1))
+
+# value conversions after reading a varint
+_VARINT_READ = {
+    betterproto.TYPE_INT32: _signed(32),
+    betterproto.TYPE_INT64: _signed(64),
+    betterproto.TYPE_SINT32: _zigzag,
+    betterproto.TYPE_SINT64: _zigzag,
+    betterproto.TYPE_BOOL: lambda v: v > 0,
+}
+
+_FIXED_FMT = {
+    betterproto.TYPE_DOUBLE: "<d",
+    betterproto.TYPE_FLOAT: "<f",
+    betterproto.TYPE_FIXED32: "<I",
+    betterproto.TYPE_FIXED64: "<Q",
+    betterproto.TYPE_SFIXED32: "<i",
+    betterproto.TYPE_SFIXED64: "<q",
+}
+
+def _wireType(proto_type: str) -> int:
+    if proto_type in betterproto.WIRE_VARINT_TYPES:
+        return betterproto.WIRE_VARINT
+    if proto_type in betterproto.WIRE_FIXED_32_TYPES:
+        return betterproto.WIRE_FIXED_32
+    if proto_type in betterproto.WIRE_FIXED_64_TYPES:
+        return betterproto.WIRE_FIXED_64
+    return betterproto.WIRE_LEN_DELIM
+
+# encoder for the payload of a single scalar value, tag excluded
+def _payloadEncoder(proto_type: str) -> Callable[[Any], bytes]:
+    if proto_type in (betterproto.TYPE_SINT32, betterproto.TYPE_SINT64):
+        return lambda v: encode_varint(v << 1 if v >= 0 else (v << 1) ^ (~0))
+    if proto_type in betterproto.WIRE_VARINT_TYPES:
+        return encode_varint
+    if proto_type in _FIXED_FMT:
+        return struct.Struct(_FIXED_FMT[proto_type]).pack
+    if proto_type == betterproto.TYPE_STRING:
+        return lambda v: v.encode("utf-8")
+    return bytes
+
+@dataclasses.dataclass
+class _FieldCodec:
+    name: str
+    number: int
+    proto_type: str
+    repeated: bool
+    packed: bool
+    cls: Optional[type]
+    default: Callable[[], Any]
+    tag: bytes
+    len_tag: bytes
+    encode: Callable[[Any], bytes]
+    read: Callable[[int, Any], Any]
+
+class _Table:
+    def __init__(self, cls: type):
+        meta = cls._betterproto_metadata()
+        self.codecs: list[_FieldCodec] = []
+        self.by_number: dict[int, _FieldCodec] = {}
+        for field in dataclasses.fields(cls):
+            fmeta = FieldMetadata.get(field)
+            if fmeta.group or fmeta.wraps or fmeta.proto_type == betterproto.TYPE_MAP:
+                raise TypeError(f"{cls.__name__}.{field.name} can't be used in a hot message")
+            default = meta.default_gen[field.name]
+            repeated = default is list
+            sub = meta.cls_by_field[field.name] if fmeta.proto_type == betterproto.TYPE_MESSAGE else None
+            codec = _FieldCodec(
+                name = field.name,
+                number = fmeta.number,
+                proto_type = fmeta.proto_type,
+                repeated = repeated,
+                packed = repeated and fmeta.proto_type in betterproto.PACKED_TYPES,
+                cls = sub,
+                default = default,
+                tag = encode_varint((fmeta.number << 3) | _wireType(fmeta.proto_type)),
+                len_tag = encode_varint((fmeta.number << 3) | betterproto.WIRE_LEN_DELIM),
+                encode = _payloadEncoder(fmeta.proto_type),
+                read = self._reader(fmeta.proto_type, sub),
+            )
+            self.codecs.append(codec)
+            self.by_number[codec.number] = codec
+
+    @staticmethod
+    def _reader(proto_type: str, sub: Optional[type]) -> Callable[[int, Any], Any]:
+        if proto_type == betterproto.TYPE_STRING:
+            return lambda wire_type, v: v.decode("utf-8") if wire_type == betterproto.WIRE_LEN_DELIM else v
+        if proto_type == betterproto.TYPE_MESSAGE:
+            def readMessage(wire_type, v):
+                message = sub().parse(v)
+                message._serialized_on_wire = True
+                return message
+            return readMessage
+        if proto_type in _FIXED_FMT:
+            unpack = struct.Struct(_FIXED_FMT[proto_type]).unpack
+            return lambda wire_type, v: unpack(v)[0] if wire_type in (betterproto.WIRE_FIXED_32, betterproto.WIRE_FIXED_64) else v
+        convert = _VARINT_READ.get(proto_type)
+        if convert is not None:
+            return lambda wire_type, v: convert(v) if wire_type == betterproto.WIRE_VARINT else v
+        return lambda wire_type, v: v
+
+class HotMessage(betterproto.Message):
+    __slots__ = ('_serialized_on_wire', '_unknown_fields', '_group_map')
+
+    _hot_table = None
+
+    @classmethod
+    def _betterproto_metadata(cls):
+        meta = cls.__dict__.get("_betterproto_meta")
+        if meta is None:
+            meta = betterproto.ProtoClassMetadata(cls)
+            cls._betterproto_meta = meta
+        return meta
+
+    @property
+    def _betterproto(self):
+        return self._betterproto_metadata()
+
+    @classmethod
+    def _table(cls) -> _Table:
+        table = cls.__dict__.get("_hot_table")
+        if table is None:
+            table = _Table(cls)
+            cls._hot_table = table
+        return table
+
+    def __post_init__(self) -> None:
+        all_sentinel = True
+        for codec in self._table().codecs:
+            if getattr(self, codec.name) is PLACEHOLDER:
+                object.__setattr__(self, codec.name, codec.default())
+            else:
+                all_sentinel = False
+        object.__setattr__(self, "_serialized_on_wire", not all_sentinel)
+        object.__setattr__(self, "_unknown_fields", b"")
+        object.__setattr__(self, "_group_map", {})
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        if attr != "_serialized_on_wire":
+            object.__setattr__(self, "_serialized_on_wire", True)
+        object.__setattr__(self, attr, value)
+
+    def __reduce__(self):
+        values = tuple(getattr(self, codec.name) for codec in self._table().codecs)
+        return (_rebuild, (type(self), values, self._serialized_on_wire, self._unknown_fields))
+
+    def parse(self, data: bytes) -> "HotMessage":
+        data = bytes(data)
+        by_number = self._table().by_number
+        setter = object.__setattr__
+        unknown = []
+        touched = False
+        pos = 0
+        end = len(data)
+        while pos < end:
+            start = pos
+            key, pos = _decodeVarint(data, pos)
+            number = key >> 3
+            wire_type = key & 0x7
+            if wire_type == 0:
+                value, pos = _decodeVarint(data, pos)
+            elif wire_type == 1:
+                value, pos = data[pos:pos + 8], pos + 8
+            elif wire_type == 2:
+                length, pos = _decodeVarint(data, pos)
+                value, pos = data[pos:pos + length], pos + length
+            elif wire_type == 5:
+                value, pos = data[pos:pos + 4], pos + 4
+            else:
+                value = None
+
+            codec = by_number.get(number)
+            if codec is None:
+                unknown.append(data[start:pos])
+                continue
+
+            if wire_type == 2 and codec.packed:
+                # packed repeated scalars replace the list, as betterproto does
+                items = []
+                i = 0
+                fixed = _FIXED_FMT.get(codec.proto_type)
+                size = struct.calcsize(fixed) if fixed else 0
+                while i < len(value):
+                    if fixed:
+                        items.append(codec.read(betterproto.WIRE_FIXED_64 if size == 8 else betterproto.WIRE_FIXED_32, value[i:i + size]))
+                        i += size
+                    else:
+                        v, i = _decodeVarint(value, i)
+                        items.append(codec.read(0, v))
+                setter(self, codec.name, items)
+                touched = True
+            elif codec.repeated:
+                getattr(self, codec.name).append(codec.read(wire_type, value))
+            else:
+                setter(self, codec.name, codec.read(wire_type, value))
+                touched = True
+
+        if touched:
+            setter(self, "_serialized_on_wire", True)
+        if unknown:
+            setter(self, "_unknown_fields", self._unknown_fields + b"".join(unknown))
+        return self
+
+    def __bytes__(self) -> bytes:
+        table = self._table()
+        out = []
+        for codec in table.codecs:
+            value = getattr(self, codec.name)
+            if value is None:
+                continue
+            if codec.repeated:
+                if not value:
+                    continue
+                if codec.packed:
+                    buf = b"".join(codec.encode(item) for item in value)
+                    out += (codec.len_tag, encode_varint(len(buf)), buf)
+                elif codec.proto_type in betterproto.WIRE_LEN_DELIM_TYPES:
+                    for item in value:
+                        payload = codec.encode(item)
+                        if payload:
+                            out += (codec.tag, encode_varint(len(payload)), payload)
+                else:
+                    for item in value:
+                        out += (codec.tag, codec.encode(item))
+            elif codec.cls is not None:
+                serialize_empty = isinstance(value, betterproto.Message) and value._serialized_on_wire
+                if not serialize_empty and value == codec.default():
+                    continue
+                payload = bytes(value)
+                if payload or serialize_empty:
+                    out += (codec.tag, encode_varint(len(payload)), payload)
+            else:
+                if value == codec.default():
+                    continue
+                payload = codec.encode(value)
+                if codec.proto_type in betterproto.WIRE_LEN_DELIM_TYPES:
+                    if payload:
+                        out += (codec.tag, encode_varint(len(payload)), payload)
+                else:
+                    out += (codec.tag, payload)
+        out.append(self._unknown_fields)
+        return b"".join(out)
+
+    SerializeToString = __bytes__
+
+def _rebuild(cls: type, values: tuple, serialized_on_wire: bool, unknown_fields: bytes) -> HotMessage:
+    message = cls.__new__(cls)
+    for codec, value in zip(cls._table().codecs, values):
+        object.__setattr__(message, codec.name, value)
+    object.__setattr__(message, "_serialized_on_wire", serialized_on_wire)
+    object.__setattr__(message, "_unknown_fields", unknown_fields)
+    object.__setattr__(message, "_group_map", {})
+    return message
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+# local imports
+import ei
+from client import getClient
+
+# per-url record of what we last downloaded, so reruns can send conditional requests
+manifest_file = "egg-icons.manifest.json"
+max_workers = 8
+chunk_size = 64 * 1024
+# read once up front, os.umask can only be read by setting it, which isn't thread safe
+umask = os.umask(0)
+os.umask(umask)
+
+def iconFilename(egg: "ei.CustomEgg") -> str:
+    # lowercase the egg name for filename
+    return f"egg_{egg.name.lower().replace(' ', '').replace('-', '')}.png"
+
+def sha256File(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def loadManifest(path: str) -> dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
+# download one icon, returning its new manifest entry and whether the file changed
+def downloadIcon(url: str, filename: str, entry: dict) -> tuple[dict, bool]:
+    headers = {}
+    # only trust validators while the file they describe is still on disk
+    if os.path.exists(filename) and entry.get('file') == filename:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    with getClient().get(url, headers=headers, stream=True) as response:
+        if response.status_code == 304:
+            return entry, False
+        response.raise_for_status()
+
+        # stream to a temp file next to the target so the rename is atomic
+        h = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size):
+                    h.update(chunk)
+                    f.write(chunk)
+            sha256 = h.hexdigest()
+            changed = not (os.path.exists(filename) and sha256File(filename) == sha256)
+            if changed:
+                # mkstemp files are 0600, give the icon the permissions a plain open() would
+                mode = os.stat(filename).st_mode if os.path.exists(filename) else 0o644 & ~umask
+                os.chmod(tmp, mode)
+                os.replace(tmp, filename)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        return {
+            'file': filename,
+            'etag': response.headers.get('ETag', ''),
+            'last_modified': response.headers.get('Last-Modified', ''),
+            'sha256': sha256,
+        }, changed
+
+# download icons for all custom eggs with bounded concurrency, skipping unchanged ones
+def downloadIcons(customEggs: list["ei.CustomEgg"], manifest_path: str = manifest_file) -> list[str]:
+    manifest = loadManifest(manifest_path)
+    eggs = [egg for egg in customEggs
+            if hasattr(egg, 'icon') and hasattr(egg.icon, 'url') and egg.icon.url]
+
+    def fetch(egg: "ei.CustomEgg"):
+        filename = iconFilename(egg)
+        try:
+            entry, changed = downloadIcon(egg.icon.url, filename, manifest.get(egg.icon.url, {}))
+        except Exception as e:
+            print(f"Failed to download icon for {egg.name}: {e}")
+            return None
+        print(f"{'Downloaded' if changed else 'Unchanged'} icon for {egg.name} -> {filename}")
+        return egg.icon.url, entry, changed
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = [r for r in pool.map(fetch, eggs) if r is not None]
+
+    for url, entry, _ in results:
+        manifest[url] = entry
+    with open(manifest_path, 'w', encoding="utf-8") as f:
+        json.dump(manifest, f, sort_keys=True, indent=2)
+
+    return [entry['file'] for _, entry, changed in results if changed]
@@ -0,0 +1,94 @@
+# Lightweight spans and counters for profiling an updatePeriodicals run.
+#
+# Disabled by default: span() then hands back a shared no-op context manager and
+# count() returns straight away, so instrumented code pays one global lookup.
+# Once enabled, spans record wall time per thread plus the process's peak RSS at
+# their end, and report() prints a per-span table and the counters. writeTrace()
+# saves everything in the Chrome trace event format (chrome://tracing, Perfetto).
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+
+enabled = False
+
+# (name, start, end, thread id, peak rss in KiB at the end)
+spans: list[tuple[str, float, float, int, int]] = []
+counters: Counter = Counter()
+_lock = threading.Lock()
+_origin = 0.0
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL = _NullSpan()
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        record = (self.name, self.start, end, threading.get_ident(), peakRss())
+        with _lock:
+            spans.append(record)
+        return False
+
+def enable():
+    global enabled, _origin
+    enabled = True
+    _origin = time.perf_counter()
+
+def span(name: str):
+    return _Span(name) if enabled else _NULL
+
+def count(name: str, n: int = 1):
+    if enabled:
+        with _lock:
+            counters[name] += n
+
+# peak resident set size of the process so far, in KiB
+def peakRss() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def report():
+    totals: dict[str, list] = {}
+    for name, start, end, _, _ in spans:
+        total = totals.setdefault(name, [0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += end - start
+        total[2] = max(total[2], end - start)
+    width = max((len(name) for name in totals), default=4)
+    print(f"{'span':<{width}} {'count':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}")
+    for name, (n, total, longest) in sorted(totals.items(), key=lambda x: -x[1][1]):
+        print(f"{name:<{width}} {n:>6} {total*1000:>10.1f} {total/n*1000:>9.2f} {longest*1000:>9.1f}")
+    for name, value in sorted(counters.items()):
+        print(f"{name}: {value}")
+    print(f"peak rss: {peakRss() / 1024:.1f} MiB")
+
+def writeTrace(file: str):
+    pid = os.getpid()
+    events = []
+    for name, start, end, tid, rss in spans:
+        events.append({ 'name': name, 'ph': 'X', 'pid': pid, 'tid': tid,
+                        'ts': (start - _origin) * 1e6, 'dur': (end - start) * 1e6 })
+        events.append({ 'name': 'peak rss KiB', 'ph': 'C', 'pid': pid, 'ts': (end - _origin) * 1e6,
+                        'args': { 'rss': rss } })
+    events.sort(key=lambda e: e['ts'])
+    with open(file, 'w', encoding="utf-8") as f:
+        json.dump({ 'traceEvents': events, 'otherData': { 'counters': dict(counters), 'peak_rss_kib': peakRss() } }, f)
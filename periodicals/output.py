@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Iterable, Iterator, Optional
+# local imports
+import instrument
+
+# outputs whose content changed during this run, in the order they were written
+changed: list[str] = []
+# outputs that were regenerated but came out identical
+unchanged: list[str] = []
+
+chunk_size = 64 * 1024
+
+def fileDigest(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+# file that hashes everything written to it, text is written as utf-8
+class HashingWriter:
+    def __init__(self, f):
+        self.f = f
+        self.hash = hashlib.sha256()
+        self.size = 0
+        self.patched = False
+
+    def write(self, s: str | bytes):
+        data = s.encode('utf-8') if isinstance(s, str) else s
+        self.hash.update(data)
+        self.size += len(data)
+        self.f.write(data)
+
+    # overwrite bytes written earlier, e.g. a header whose offsets are only known at the end
+    def patch(self, offset: int, data: bytes):
+        end = self.f.tell()
+        self.f.seek(offset)
+        self.f.write(data)
+        self.f.seek(end)
+        self.patched = True
+
+    def hexdigest(self) -> str:
+        if not self.patched:
+            return self.hash.hexdigest()
+        # the running hash is stale after a patch, hash the file again
+        end = self.f.tell()
+        self.f.seek(0)
+        h = hashlib.sha256()
+        for chunk in iter(lambda: self.f.read(chunk_size), b''):
+            h.update(chunk)
+        self.f.seek(end)
+        return h.hexdigest()
+
+# stream output into a temp file next to the target while fingerprinting it, and only
+# replace the target (atomically) when the content differs
+class OutputFile:
+    def __init__(self, file: str):
+        self.file = file
+        self.replaced = False
+
+    def __enter__(self) -> HashingWriter:
+        # spans the whole write, including producing lazily merged records
+        self.span = instrument.span(f'write {self.file}')
+        self.span.__enter__()
+        fd, self.tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.file)), suffix='.tmp')
+        self.writer = HashingWriter(os.fdopen(fd, 'w+b'))
+        return self.writer
+
+    def __exit__(self, exc_type, exc, tb):
+        digest = self.writer.hexdigest() if exc_type is None else None
+        self.writer.f.close()
+        try:
+            if exc_type is None and digest != fileDigest(self.file):
+                # keep the permissions of the file being replaced
+                mode = os.stat(self.file).st_mode if os.path.exists(self.file) else 0o644
+                os.chmod(self.tmp, mode)
+                os.replace(self.tmp, self.file)
+                self.replaced = True
+        finally:
+            if os.path.exists(self.tmp):
+                os.remove(self.tmp)
+        if exc_type is None:
+            (changed if self.replaced else unchanged).append(self.file)
+        instrument.count('bytes written', self.writer.size)
+        self.span.__exit__(exc_type, exc, tb)
+
+# json.dump to file, only touching it when the content changed. Returns whether it did.
+# Files end with a newline like the go updater's json.Encoder writes them, so a run of
+# either updater leaves the other's unchanged outputs alone.
+def writeJson(data: Any, file: str, newline: bool = True, **kwargs) -> bool:
+    kwargs.setdefault('sort_keys', True)
+    kwargs.setdefault('indent', 2)
+    out = OutputFile(file)
+    with out as f:
+        json.dump(data, f, **kwargs)
+        if newline:
+            f.write('\n')
+    return out.replaced
+
+# records as a json array one at a time, formatted exactly like
+# json.dump(list(records), f, indent=2, sort_keys=True) but without holding them all
+def jsonRecords(records: Iterable[Any]) -> Iterator[str]:
+    first = True
+    for record in records:
+        yield '[\n  ' if first else ',\n  '
+        # json escapes newlines inside strings, so every raw newline is indentation
+        yield json.dumps(record, indent=2, sort_keys=True).replace('\n', '\n  ')
+        first = False
+    yield '[]' if first else '\n]'
+
+def writeJsonRecords(records: Iterable[Any], file: str, newline: bool = True) -> bool:
+    out = OutputFile(file)
+    with out as f:
+        for text in jsonRecords(records):
+            f.write(text)
+        if newline:
+            f.write('\n')
+    return out.replaced
+
+# print which outputs changed, and expose them to GitHub Actions as the `changed` step output
+def reportChanged():
+    print(f"Changed outputs: {' '.join(changed) if changed else 'none'}")
+    github_output = os.environ.get('GITHUB_OUTPUT')
+    if github_output:
+        with open(github_output, 'a', encoding="utf-8") as f:
+            f.write(f"changed={' '.join(changed)}\n")
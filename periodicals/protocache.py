@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+from typing import Callable, Optional
+# local imports
+import output
+
+def digest(proto: str) -> str:
+    return hashlib.sha1(proto.encode('utf-8')).hexdigest()
+
+# content-addressed cache of the fields extracted from b64 protos
+# keyed by a digest of the b64 string, so a stored record that didn't change is
+# never parsed again. Eviction is by generation: a save that changes anything
+# starts a new generation, entries that weren't used in it are marked with the
+# generation they went unused in, and are dropped `keep` generations later.
+# Entries in use carry no bookkeeping, so a run that changes nothing leaves the
+# file alone.
+class ProtoCache:
+    def __init__(self, extract: Callable[[str], dict], fields: tuple[str, ...], data: dict, keep: int = 8):
+        # extract: b64 proto -> entry with the given fields
+        self.extract = extract
+        self.fields = fields
+        self.keep = keep
+        self.generation: int = data.get('generation', 0)
+        self.entries: dict[str, dict] = data.get('entries', {})
+        self.used: set[str] = set()
+        self.added = 0
+        # number of protos that had to be parsed because the cache didn't know them
+        self.misses = 0
+
+    @classmethod
+    def load(cls, file: str, extract: Callable[[str], dict], fields: tuple[str, ...], keep: int = 8) -> "ProtoCache":
+        data = {}
+        if os.path.exists(file):
+            with open(file, 'r', encoding="utf-8") as f:
+                data = json.load(f)
+            if 'entries' not in data:
+                # plain { digest: entry } index from before generations
+                data = { 'entries': data }
+        return cls(extract, fields, data, keep)
+
+    # entry for a proto, parsing it only if it isn't cached yet or was cached before a field was added
+    def get(self, proto: str) -> dict:
+        key = digest(proto)
+        entry = self.entries.get(key)
+        if entry is None or any(field not in entry for field in self.fields):
+            self.misses += 1
+            entry = self.put(proto, self.extract(proto), key)
+        self.used.add(key)
+        return entry
+
+    def put(self, proto: str, entry: dict, key: Optional[str] = None) -> dict:
+        key = key or digest(proto)
+        if self.entries.get(key) != entry:
+            self.added += 1
+        self.entries[key] = entry
+        self.used.add(key)
+        return entry
+
+    # age out entries that weren't used since load and persist
+    def save(self, file: str) -> bool:
+        unused = [key for key in self.entries if key not in self.used]
+        fresh = [key for key in unused if 'unused_since' not in self.entries[key]]
+        revived = [key for key in self.used if 'unused_since' in self.entries.get(key, {})]
+        if self.added or fresh or revived:
+            self.generation += 1
+        for key in revived:
+            del self.entries[key]['unused_since']
+        for key in unused:
+            entry = self.entries[key]
+            entry.setdefault('unused_since', self.generation)
+            if self.generation - entry['unused_since'] >= self.keep:
+                del self.entries[key]
+        return output.writeJson({ 'generation': self.generation, 'entries': self.entries }, file)
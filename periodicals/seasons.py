@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# Per-season contract files.
+#
+# data/seasons/<season id>.json holds the contracts of one season in contracts.json
+# order and format. data/seasons/index.json describes the known seasons (from
+# ContractSeasonInfos and the current season of the ContractsResponse) with the ids of
+# each season's contracts. A run only rewrites the seasons whose contracts changed, and
+# the current season file is copied from its season file instead of filtering the
+# whole archive.
+#
+# usage:
+#   seasons.py rebuild      regenerate every season file from data/contracts.json
+import json
+import os
+import sys
+import time
+from typing import Iterable, Optional
+# local imports
+import defaults
+import output
+import utils
+from archive import ContractArchive, seasonCache
+
+class SeasonIndex:
+    def __init__(self, directory: str, index: dict):
+        self.directory = directory
+        self.current: str = index.get('current', '')
+        # digest of the contracts.json the season files were derived from
+        self.source: str = index.get('source', '')
+        # season id -> { name, start_time, contracts: [contract ids in file order] }
+        self.seasons: dict[str, dict] = index.get('seasons', {})
+
+    @classmethod
+    def load(cls, directory: str = defaults.seasons_dir) -> "SeasonIndex":
+        index = {}
+        index_file = os.path.join(directory, 'index.json')
+        if os.path.exists(index_file):
+            with open(index_file, 'r', encoding="utf-8") as f:
+                index = json.load(f)
+        return cls(directory, index)
+
+    def path(self, season_id: str) -> str:
+        return os.path.join(self.directory, f'{season_id}.json')
+
+    # the season files can only be updated incrementally if they were derived from the
+    # current archive, e.g. not after the go updater rewrote it, and none went missing
+    def complete(self, contract_file: str) -> bool:
+        return (bool(self.seasons) and self.source == output.fileDigest(contract_file)
+                and all(os.path.exists(self.path(id)) for id in self.seasons))
+
+    def season(self, season_id: str) -> dict:
+        return self.seasons.setdefault(season_id, { 'name': '', 'start_time': 0, 'contracts': [] })
+
+    # fill in season names and start times from season index entries, later entries win
+    def describe(self, infos: Iterable[dict]):
+        for info in infos:
+            if not info['id']:
+                continue
+            season = self.season(info['id'])
+            season['name'] = info['name'] or season['name']
+            season['start_time'] = info['start_time'] or season['start_time']
+
+    # season that is running now: the api's current season, else the latest started one. A
+    # stored current season is only kept while no season has started after it.
+    def currentSeason(self, current: Optional[str] = None, now: Optional[float] = None) -> str:
+        now = time.time() if now is None else now
+        if current:
+            self.current = current
+            return self.current
+        started = [(s['start_time'], id) for id, s in self.seasons.items() if 0 < s['start_time'] <= now]
+        if started:
+            latest = max(started)
+            stored = self.seasons.get(self.current, {}).get('start_time', 0)
+            if not latest[0] <= stored <= now:
+                self.current = latest[1]
+        return self.current
+
+    def write(self, season_id: str, stores: list[dict]):
+        self.season(season_id)['contracts'] = [store['id'] for store in stores]
+        output.writeJsonRecords(stores, self.path(season_id))
+
+    # regenerate every season file from the full list of stores
+    def rebuild(self, stores: Iterable[dict], archive: ContractArchive):
+        grouped: dict[str, list[dict]] = {}
+        for store in stores:
+            season_id = archive.entry(store)['season_id']
+            if season_id:
+                grouped.setdefault(season_id, []).append(store)
+        for season_id in self.seasons:
+            grouped.setdefault(season_id, [])
+        for season_id, season_stores in grouped.items():
+            self.write(season_id, season_stores)
+
+    # rewrite only the given seasons. Expired contracts never change, so each season keeps
+    # the expired part of its own file and gets its live contracts appended, which is
+    # exactly what filtering the merged archive by season would produce.
+    def update(self, seasons: Iterable[str], live: list[dict], archive: ContractArchive, now: float):
+        for season_id in sorted(set(seasons) - {''}):
+            path = self.path(season_id)
+            stores = []
+            if os.path.exists(path):
+                stores = [store for store in utils.iterJsonArray(path)
+                          if archive.entry(store)['expiration_time'] <= now]
+            stores += [store for store in live if archive.entry(store)['season_id'] == season_id]
+            self.write(season_id, stores)
+
+    # copy the current season's contracts to file, like the go updater skipping empty seasons
+    def writeCurrent(self, file: str):
+        if not self.current or not os.path.exists(self.path(self.current)):
+            return
+        stores = list(utils.iterJsonArray(self.path(self.current)))
+        if stores:
+            output.writeJsonRecords(stores, file)
+
+    def save(self, contract_file: Optional[str] = None):
+        if contract_file is not None:
+            self.source = output.fileDigest(contract_file) or ''
+        output.writeJson({ 'current': self.current, 'source': self.source, 'seasons': self.seasons },
+                         os.path.join(self.directory, 'index.json'))
+
+# index entries of the season infos stored in data/contractseasons.json, through its proto cache
+def storedSeasonInfos(file: str = defaults.contract_seasons_file,
+                      index_file: str = defaults.contract_seasons_index_file) -> list[dict]:
+    if not os.path.exists(file):
+        return []
+    cache = seasonCache(index_file)
+    return [cache.get(store['proto']) for store in utils.iterJsonArray(file)]
+
+def main():
+    if sys.argv[1:] != ['rebuild']:
+        sys.exit("usage: seasons.py rebuild")
+    os.makedirs(defaults.seasons_dir, exist_ok=True)
+    archive = ContractArchive.load(defaults.contract_file, defaults.contract_index_file)
+    index = SeasonIndex.load()
+    index.describe(storedSeasonInfos())
+    index.rebuild(archive.stores(), archive)
+    index.currentSeason()
+    index.writeCurrent(defaults.season_contract_file)
+    index.save(defaults.contract_file)
+    output.reportChanged()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# Local stand-in for the auxbrain endpoints updatePeriodicals.py talks to.
+#
+# Serves recorded response bodies on /ei/get_periodicals and
+# /ei_ctx/get_season_infos_v2 (any path with a fixture really), with optional
+# latency and failure injection, so the pipeline and the client's retries can be
+# exercised with no network.
+#
+# Fixtures are raw response bodies (b64 AuthenticatedMessage), one file per
+# endpoint named by client.fixtureName. Record real ones by running the updater
+# with EI_RECORD_DIR=fixtures, or synthesize them from data/*.json.
+#
+# usage:
+#   standin.py synthesize [--fixtures DIR]
+#   standin.py serve [--fixtures DIR] [--port N] [--latency S] [--jitter S]
+#                    [--fail-rate P] [--fail-status CODE] [--drop-rate P] [--fail-first N]
+#
+#   EI_BASE_URL=http://127.0.0.1:8080 ./updatePeriodicals.py events contracts
+import argparse
+import base64
+import os
+import random
+import threading
+import time
+import zlib
+import betterproto
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+# local imports
+import ei
+import defaults
+import utils
+from client import fixtureName
+
+# live data the synthesized responses carry, taken from the end of the archives
+LIVE_EVENTS = 4
+LIVE_CONTRACTS = 12
+
+def authenticated(message: "betterproto.Message") -> bytes:
+    data = bytes(message)
+    auth = ei.AuthenticatedMessage(message=zlib.compress(data), compressed=True, original_size=len(data))
+    return base64.b64encode(bytes(auth))
+
+# responses built from the stored archives, starting now so the live data is current
+def synthesize(directory: str):
+    now = time.time()
+    events = list(utils.iterJsonArray(defaults.event_file))[-LIVE_EVENTS:]
+    contracts = utils.decodeMany(ei.Contract, [store['proto'] for store in
+                                               list(utils.iterJsonArray(defaults.contract_file))[-LIVE_CONTRACTS:]])
+    for contract in contracts:
+        contract.expiration_time = now + (contract.expiration_time - contract.start_time if contract.start_time else 7 * 86400)
+        contract.start_time = now
+    seasons = [utils.decode(ei.ContractSeasonInfo(), store['proto'], False)
+               for store in utils.iterJsonArray(defaults.contract_seasons_file)]
+    eggs = [utils.decode(ei.CustomEgg(), proto, False) for proto in utils.iterJsonArray(defaults.egg_file)]
+
+    periodicals = ei.PeriodicalsResponse(
+        events = ei.EggIncCurrentEvents(events=[ei.EggIncEvent(
+            identifier = e['id'],
+            type       = e['type'],
+            multiplier = e['multiplier'],
+            subtitle   = e['message'],
+            start_time = now,
+            duration   = e['endTimestamp'] - e['startTimestamp'],
+            cc_only    = e['ultra']) for e in events]),
+        contracts = ei.ContractsResponse(
+            contracts      = contracts,
+            custom_eggs    = eggs,
+            current_season = seasons[-1] if seasons else ei.ContractSeasonInfo()))
+
+    os.makedirs(directory, exist_ok=True)
+    for url, message in ((defaults.url, periodicals), (defaults.season_info_url, ei.ContractSeasonInfos(infos=seasons))):
+        path = os.path.join(directory, fixtureName(url.removeprefix(defaults.base_url)))
+        with open(path, 'wb') as f:
+            f.write(authenticated(message))
+        print(f"wrote {path}")
+
+class StandIn(ThreadingHTTPServer):
+    def __init__(self, address, fixtures: str, latency: float = 0, jitter: float = 0, fail_rate: float = 0,
+                 fail_status: int = 503, drop_rate: float = 0, fail_first: int = 0):
+        super().__init__(address, Handler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.drop_rate = drop_rate
+        self.fail_first = fail_first
+        # requests seen per path, for fail_first
+        self.seen: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+class Handler(BaseHTTPRequestHandler):
+    server: StandIn
+
+    def respond(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        with server.lock:
+            count = server.seen[self.path] = server.seen.get(self.path, 0) + 1
+
+        time.sleep(max(0, server.latency + random.uniform(-server.jitter, server.jitter)))
+        if random.random() < server.drop_rate:
+            # hang up without a response, the client sees a connection error
+            self.close_connection = True
+            return
+        if count <= server.fail_first or random.random() < server.fail_rate:
+            self.send_error(server.fail_status)
+            return
+
+        path = os.path.join(server.fixtures, fixtureName(self.path.split('?')[0]))
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} {format % args}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the auxbrain endpoints")
+    parser.add_argument('command', choices=['serve', 'synthesize'])
+    parser.add_argument('--fixtures', default=defaults.fixtures_dir)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0, help="latency varies by up to this many seconds")
+    parser.add_argument('--fail-rate', type=float, default=0, help="fraction of requests answered with --fail-status")
+    parser.add_argument('--fail-status', type=int, default=503)
+    parser.add_argument('--drop-rate', type=float, default=0, help="fraction of connections closed without a response")
+    parser.add_argument('--fail-first', type=int, default=0, help="fail the first N requests to each path")
+    args = parser.parse_args()
+
+    if args.command == 'synthesize':
+        synthesize(args.fixtures)
+        return
+
+    server = StandIn((args.host, args.port), args.fixtures, args.latency, args.jitter, args.fail_rate,
+                     args.fail_status, args.drop_rate, args.fail_first)
+    print(f"serving {args.fixtures} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
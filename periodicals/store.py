@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# SQLite archive of contracts, events and contract seasons.
+#
+# An alternative to rewriting the monolithic data/*.json files on every run:
+# updates are upserts that only touch the rows that changed, ad-hoc queries go
+# through indexes, and the json files are exported from the database on demand
+# in exactly the format updatePeriodicals.py writes them.
+#
+# usage:
+#   store.py import [--db FILE]                 build the database from data/*.json
+#   store.py export [--db FILE]                 write data/*.json from the database
+#   store.py contracts [--egg EGG] [--season SEASON] [--custom-egg ID] [--db FILE]
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Iterable, Iterator, Optional
+from more_itertools import unique_everseen
+# local imports
+import ei
+import defaults
+import output
+import utils
+from eventindex import SAME_EVENT_WINDOW
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS contracts (
+    seq             INTEGER PRIMARY KEY,
+    id              TEXT NOT NULL,
+    start_time      REAL NOT NULL,
+    expiration_time REAL NOT NULL,
+    season_id       TEXT NOT NULL,
+    egg             INTEGER NOT NULL,
+    custom_egg_id   TEXT NOT NULL,
+    proto           TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contracts_id ON contracts (id, expiration_time);
+CREATE INDEX IF NOT EXISTS contracts_expiration ON contracts (expiration_time);
+CREATE INDEX IF NOT EXISTS contracts_season_egg ON contracts (season_id, egg);
+CREATE INDEX IF NOT EXISTS contracts_custom_egg ON contracts (custom_egg_id);
+
+CREATE TABLE IF NOT EXISTS events (
+    seq             INTEGER PRIMARY KEY,
+    id              TEXT NOT NULL,
+    start_timestamp REAL NOT NULL,
+    end_timestamp   REAL NOT NULL,
+    type            TEXT NOT NULL,
+    record          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_id_start ON events (id, start_timestamp);
+CREATE INDEX IF NOT EXISTS events_type_start ON events (type, start_timestamp);
+
+CREATE TABLE IF NOT EXISTS seasons (
+    seq             INTEGER PRIMARY KEY,
+    id              TEXT NOT NULL UNIQUE,
+    start_time      REAL NOT NULL,
+    proto           TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key             TEXT PRIMARY KEY,
+    value           TEXT NOT NULL
+);
+'''
+
+class Store:
+    def __init__(self, file: str = defaults.store_file):
+        self.db = sqlite3.connect(file)
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.db.commit()
+        self.db.close()
+
+    # whether the archive was ever imported from the json files. A new database is
+    # empty, and exporting it would wipe the json archives.
+    def imported(self) -> bool:
+        return self.db.execute("SELECT 1 FROM meta WHERE key = 'imported'").fetchone() is not None
+
+    # contracts
+
+    # fields: the utils.CONTRACT_SCAN_FIELDS of the contract
+    def _insertContract(self, fields: dict, proto: str):
+        self.db.execute(
+            'INSERT INTO contracts (id, start_time, expiration_time, season_id, egg, custom_egg_id, proto) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (fields['identifier'], fields['start_time'], fields['expiration_time'],
+             fields['season_id'], int(fields['egg']), fields['custom_egg_id'], proto))
+
+    # active contracts replace every stored contract with the same id that may still be running,
+    # mirroring how getContracts merges live api data into the archive. The contracts that may
+    # still be running are reinserted in the order getContracts writes them: by start time, with
+    # the active ones first among equal starts, so seq order is contracts.json order.
+    def upsertContracts(self, active: Iterable["ei.Contract"], now: Optional[float] = None):
+        now = time.time() if now is None else now
+        active = [({ name: getattr(contract, name) for name in utils.CONTRACT_SCAN_FIELDS }, utils.encode(contract))
+                  for contract in active]
+        recent = [(dict(zip(utils.CONTRACT_SCAN_FIELDS, row[:-1])), row[-1]) for row in self.db.execute(
+            'SELECT id, start_time, expiration_time, season_id, egg, custom_egg_id, proto FROM contracts '
+            'WHERE expiration_time > ? ORDER BY seq', (now,))]
+        self.db.execute('DELETE FROM contracts WHERE expiration_time > ?', (now,))
+        for fields, proto in sorted(unique_everseen(active + recent, key=lambda x: x[0]['identifier']),
+                                    key=lambda x: x[0]['start_time']):
+            self._insertContract(fields, proto)
+
+    # contracts in { id: contract id, proto: b64 contract proto } form, in contracts.json order
+    def contracts(self, now: Optional[float] = None) -> Iterator[dict]:
+        now = time.time() if now is None else now
+        expired = self.db.execute('SELECT id, proto FROM contracts WHERE expiration_time <= ? ORDER BY seq', (now,))
+        live = self.db.execute('SELECT id, proto FROM contracts WHERE expiration_time > ? ORDER BY seq', (now,))
+        for cursor in (expired, live):
+            for id, proto in cursor:
+                yield { 'id': id, 'proto': proto }
+
+    def query(self, egg: Optional[int] = None, season_id: Optional[str] = None,
+              custom_egg_id: Optional[str] = None) -> Iterator[dict]:
+        clauses, params = [], []
+        for column, value in (('egg', egg), ('season_id', season_id), ('custom_egg_id', custom_egg_id)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        for id, proto in self.db.execute(f'SELECT id, proto FROM contracts {where} ORDER BY start_time, seq', params):
+            yield { 'id': id, 'proto': proto }
+
+    # events
+
+    # drop every stored copy of an event, i.e. the same id starting within the same-event window
+    def _deleteEvent(self, event: dict):
+        self.db.execute(
+            'DELETE FROM events WHERE id = ? AND start_timestamp > ? AND start_timestamp < ?',
+            (event['id'], event['startTimestamp'] - SAME_EVENT_WINDOW, event['startTimestamp'] + SAME_EVENT_WINDOW))
+
+    def _insertEvent(self, event: dict):
+        self.db.execute(
+            'INSERT INTO events (id, start_timestamp, end_timestamp, type, record) VALUES (?, ?, ?, ?, ?)',
+            (event['id'], event['startTimestamp'], event['endTimestamp'], event['type'],
+             json.dumps(event, sort_keys=True)))
+
+    # active events replace the stored events with the same id starting within the same-event
+    # window and move to the end, like getEvents. All the stored copies go before any active
+    # event is inserted, so active events never replace each other.
+    def upsertEvents(self, active: Iterable[dict]):
+        active = sorted(active, key=lambda x: (x['startTimestamp'], x['id']))
+        for event in active:
+            self._deleteEvent(event)
+        for event in active:
+            self._insertEvent(event)
+
+    def events(self) -> Iterator[dict]:
+        for record, in self.db.execute('SELECT record FROM events ORDER BY seq'):
+            yield json.loads(record)
+
+    # seasons
+
+    def upsertSeasons(self, infos: Iterable["ei.ContractSeasonInfo"]):
+        for season in infos:
+            self.db.execute(
+                'INSERT INTO seasons (id, start_time, proto) VALUES (?, ?, ?) '
+                'ON CONFLICT (id) DO UPDATE SET start_time = excluded.start_time, proto = excluded.proto',
+                (season.id, season.start_time, utils.encode(season)))
+
+    def seasons(self) -> Iterator[dict]:
+        for id, proto in self.db.execute('SELECT id, proto FROM seasons ORDER BY start_time, seq'):
+            yield { 'id': id, 'proto': proto }
+
+    # json import / export
+
+    def importJson(self, contract_file: str = defaults.contract_file, event_file: str = defaults.event_file,
+                   seasons_file: str = defaults.contract_seasons_file):
+        self.db.execute('DELETE FROM contracts')
+        # only the indexed columns are needed, so scan them instead of decoding every contract
+        stores = list(utils.iterJsonArray(contract_file))
+        for store, fields in zip(stores, utils.scanContracts(stores)):
+            self._insertContract(fields, store['proto'])
+        self.db.execute('DELETE FROM events')
+        for event in utils.iterJsonArray(event_file):
+            self._insertEvent(event)
+        self.db.execute('DELETE FROM seasons')
+        for store in utils.iterJsonArray(seasons_file):
+            season = utils.decode(ei.ContractSeasonInfo(), store['proto'], False)
+            self.db.execute('INSERT INTO seasons (id, start_time, proto) VALUES (?, ?, ?)',
+                            (store['id'], season.start_time, store['proto']))
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported', ?)", (str(time.time()),))
+        self.db.commit()
+
+    # write the json archives, skipping any file passed as None
+    def exportJson(self, contract_file: Optional[str] = defaults.contract_file,
+                   event_file: Optional[str] = defaults.event_file,
+                   seasons_file: Optional[str] = defaults.contract_seasons_file, now: Optional[float] = None):
+        if not self.imported():
+            raise RuntimeError("Refusing to export an archive that was never imported, run store.py import first")
+        if contract_file is not None:
+            output.writeJsonRecords(self.contracts(now), contract_file)
+        if event_file is not None:
+            output.writeJsonRecords(self.events(), event_file)
+        if seasons_file is not None:
+            output.writeJsonRecords(self.seasons(), seasons_file)
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite archive of contracts, events and contract seasons")
+    parser.add_argument('command', choices=['import', 'export', 'contracts'])
+    parser.add_argument('--db', default=defaults.store_file)
+    parser.add_argument('--egg', help="egg name or number, e.g. CHOCOLATE")
+    parser.add_argument('--season')
+    parser.add_argument('--custom-egg')
+    args = parser.parse_args()
+
+    if args.command != 'import' and not os.path.exists(args.db):
+        sys.exit(f"{args.db} doesn't exist, run store.py import first")
+    with Store(args.db) as store:
+        if args.command != 'import' and not store.imported():
+            sys.exit(f"{args.db} was never imported, run store.py import first")
+        match args.command:
+            case 'import':
+                store.importJson()
+            case 'export':
+                store.exportJson()
+                output.reportChanged()
+            case 'contracts':
+                egg = None
+                if args.egg is not None:
+                    egg = int(args.egg) if args.egg.isdigit() else ei.Egg.from_string(args.egg.upper())
+                for contract in store.query(egg, args.season, args.custom_egg):
+                    print(contract['id'])
+
+if __name__ == "__main__":
+    main()
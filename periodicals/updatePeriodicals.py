@@ -1,31 +1,134 @@
+import os
 import sys
-import requests
 import time
 import json
 import base64
+import hashlib
+import itertools
+from typing import Callable, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+import betterproto
 from more_itertools import unique_everseen
 # local imports
 import ei
 import defaults
 import utils
+from client import getClient
+from eventindex import EventIndex
+from archive import ContractArchive, ContractSeasonIndexEntry, seasonCache
+from seasons import SeasonIndex, storedSeasonInfos
+from colleggtible import CustomEggIndex, colleggtibleContracts
+import binarchive
+import eventshards
+import eventstats
+import icons
+import instrument
+import output
+from store import Store
+
+# subcommands that need the periodicals response
+PERIODICALS_COMMANDS = {"events", "contracts", "customeggs", "download-customeggs"}
+# the only parts of the periodicals response the subcommands read
+PERIODICALS_FIELDS = ["events.events", "contracts.contracts", "contracts.custom_eggs", "contracts.current_season"]
+# response part each subcommand is derived from, a subcommand whose part is unchanged
+# since it last ran is skipped. download-customeggs always runs since the icons
+# aren't kept between runs.
+COMMAND_PARTS = {"events": "events", "contracts": "contracts", "customeggs": "contracts",
+                 "contractseasons": "season_info"}
+# exit status when every requested subcommand was skipped, colleggtible-contracts
+# counts as skipped when contracts and customeggs both are
+UNCHANGED_EXIT = 3
 
 def main():
-    # api request to get current events
-    periodicals_response = requestPeriodicals()
-    periodicals = utils.decode(
-        ei.PeriodicalsResponse(), periodicals_response)
-    if "events" in sys.argv:
-         updateEvents(periodicals.events.events, defaults.event_file)
-    if "contracts" in sys.argv:
-        updateContracts(periodicals.contracts.contracts, defaults.contract_file)
-    if "customeggs" in sys.argv:
-        updateCustomEggs(periodicals.contracts.custom_eggs, defaults.egg_file)
-    if "download-customeggs" in sys.argv:
-        updateCustomEggs(periodicals.contracts.custom_eggs, defaults.egg_file, True)
-    if "contractseasons" in sys.argv:
-        season_info_response = requestSeasonInfo()
-        season_info = utils.decode(ei.ContractSeasonInfos(), season_info_response)
-        updateContractSeasons(season_info, defaults.contract_seasons_file)
+    commands = set(sys.argv[1:])
+    # --profile: time every stage and write a chrome trace to defaults.profile_file
+    if "--profile" in commands:
+        instrument.enable()
+    # fetch and decode everything the requested subcommands need at once
+    with instrument.span('fetch'):
+        responses = fetchAll(commands)
+    periodicals = responses.get('periodicals')
+
+    # skip the subcommands whose input didn't change, unless --force
+    digests = responseDigests(responses)
+    stored = loadDigests(defaults.digest_file)
+    skipped = set()
+    if "--force" not in commands:
+        skipped = {c for c in commands if c in COMMAND_PARTS and stored.get(c) == digests.get(COMMAND_PARTS[c])}
+        # colleggtible-contracts is derived from the contracts and custom eggs written by those subcommands
+        if "colleggtible-contracts" in commands and {"contracts", "customeggs"} <= skipped:
+            skipped.add("colleggtible-contracts")
+    if skipped:
+        print(f"Unchanged since the last run: {' '.join(sorted(skipped))}")
+        commands -= skipped
+        if not commands & (set(COMMAND_PARTS) | {"download-customeggs", "colleggtible-contracts"}):
+            getClient().report()
+            sys.exit(UNCHANGED_EXIT)
+    # the subcommands --store handles still count as run
+    ran = set(commands)
+    if "--store" in commands:
+        with instrument.span('store'):
+            updateStore(periodicals, responses.get('season_info'), commands)
+        commands -= {"events", "contracts", "contractseasons"}
+    if "events" in commands:
+        with instrument.span('events'):
+            updateEvents(periodicals.events.events, defaults.event_file)
+    if "contracts" in commands:
+        with instrument.span('contracts'):
+            updateContracts(periodicals.contracts.contracts, defaults.contract_file, periodicals.contracts.current_season)
+    if "customeggs" in commands:
+        with instrument.span('customeggs'):
+            updateCustomEggs(periodicals.contracts.custom_eggs, defaults.egg_file)
+    if "download-customeggs" in commands:
+        with instrument.span('download-customeggs'):
+            updateCustomEggs(periodicals.contracts.custom_eggs, defaults.egg_file, True)
+    if "contractseasons" in commands:
+        with instrument.span('contractseasons'):
+            updateContractSeasons(responses['season_info'], defaults.contract_seasons_file)
+    # after contracts and customeggs, which it is derived from
+    if "colleggtible-contracts" in commands:
+        with instrument.span('colleggtible-contracts'):
+            updateColleggtibleContracts(defaults.contract_file, defaults.egg_file, defaults.colleggtible_contracts_file)
+
+    # remember what each subcommand that ran was derived from
+    stored.update({ c: digests[COMMAND_PARTS[c]] for c in ran if c in COMMAND_PARTS and COMMAND_PARTS[c] in digests })
+    output.writeJson(stored, defaults.digest_file)
+
+    getClient().report()
+    output.reportChanged()
+    if instrument.enabled:
+        instrument.report()
+        instrument.writeTrace(defaults.profile_file)
+        print(f"Wrote trace to {defaults.profile_file}")
+
+# sha256 of each part of the responses the subcommands are derived from
+def responseDigests(responses: dict[str, betterproto.Message]) -> dict[str, str]:
+    parts = {}
+    if 'periodicals' in responses:
+        parts['events'] = responses['periodicals'].events
+        parts['contracts'] = responses['periodicals'].contracts
+    if 'season_info' in responses:
+        parts['season_info'] = responses['season_info']
+    return { name: hashlib.sha256(bytes(part)).hexdigest() for name, part in parts.items() }
+
+def loadDigests(file: str) -> dict[str, str]:
+    if not os.path.exists(file):
+        return {}
+    with open(file, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
+# issue every request the subcommands need concurrently, decoding each response
+# as soon as it arrives, so wall-clock time is close to the slowest request
+def fetchAll(commands: set[str]) -> dict[str, betterproto.Message]:
+    jobs = {}
+    with ThreadPoolExecutor() as pool:
+        if commands & PERIODICALS_COMMANDS:
+            jobs['periodicals'] = pool.submit(
+                lambda: utils.decodeStream(ei.PeriodicalsResponse(), requestPeriodicals(), fields=PERIODICALS_FIELDS))
+        if "contractseasons" in commands:
+            jobs['season_info'] = pool.submit(
+                lambda: utils.decodeStream(ei.ContractSeasonInfos(), requestSeasonInfo()))
+    return { name: job.result() for name, job in jobs.items() }
 
 
 def updateCustomEggs(customEggs: list["ei.CustomEgg"], file: str, download: bool = False):
@@ -37,59 +140,53 @@ def updateCustomEggs(customEggs: list["ei.CustomEgg"], file: str, download: bool
 
     # download egg icons if requested
     if download:
-        for egg in customEggs:
-            if hasattr(egg, 'icon') and hasattr(egg.icon, 'url') and egg.icon.url:
-                try:
-                    # lowercase the egg name for filename
-                    filename = f"egg_{egg.name.lower().replace(' ', '').replace('-', '')}.png"
-
-                    print(f"Downloading icon for {egg.name} to {filename}")
-                    icon_response = requests.get(egg.icon.url)
-                    icon_response.raise_for_status()
-
-                    with open(filename, 'wb') as icon_file:
-                        icon_file.write(icon_response.content)
-                except Exception as e:
-                    print(f"Failed to download icon for {egg.name}: {e}")
+        icons.downloadIcons(customEggs)
         return
 
     # write json array of customegg protos
-    with open(file, 'w', encoding="utf-8") as f:
-        json.dump([base64.b64encode(bytes(egg)).decode("utf-8") for egg in customEggs], f, sort_keys=True, indent=2)
+    output.writeJson([base64.b64encode(bytes(egg)).decode("utf-8") for egg in customEggs], file)
 
 # events: list of currently active events
 # updates existing list of events with current events
-def getEvents(events: list["ei.EggIncEvent"], file: str) -> list["Event"]:
+def getEvents(events: list["ei.EggIncEvent"], file: str) -> Iterator["Event"]:
 
     # create array of current events
     active = sorted([Event(event) for event in events],
                     key=lambda x: (x['startTimestamp'], x['id']),
                     )
 
-    # read past events into object
-    with open(file, 'r', encoding="utf-8") as f:
-        past = json.load(f)
+    activeIndex = EventIndex(active)
 
-    # list of all events in order
-    return [ event for event in past if not listContainsEvent(active, event) ] + active
+    # stream past events, dropping the ones replaced by an active event
+    def past() -> Iterator["Event"]:
+        for event in utils.iterJsonArray(file):
+            if event in activeIndex:
+                continue
+            # flag stored events that collide with an active event without being the same event
+            for e in activeIndex.overlapping(event):
+                print(f"Event {e['id']} starting {e['startTimestamp']} overlaps stored event starting {event['startTimestamp']}")
+            yield event
 
-def listContainsEvent(eventList: list["Event"], event: "Event") -> bool:
-    for e in eventList:
-        # Events are considered the same if they have the same id and start within 2 days of each other
-        if event['id'] == e['id'] and abs(event['startTimestamp'] - e['startTimestamp']) < 2*86400:
-            return True
-    return False
+    # all events in order
+    return itertools.chain(past(), active)
 
 # get events and persist to file
 def updateEvents(activeEvents:list[ei.EggIncEvent], file: str):
 
     events = getEvents(activeEvents, file)
 
-    with open(file, 'w', encoding="utf-8") as f:
-        json.dump(events, f, sort_keys=True, indent=2)
+    output.writeJsonRecords(events, file)
+    updateEventOutputs(file)
 
-# get list of all contracts from active contracts and past contract list
-def getContracts(active: list["ei.Contract"], file: str) -> list["ContractStore"]:
+# outputs derived from the event archive
+def updateEventOutputs(file: str):
+    with instrument.span('events.shards'):
+        eventshards.write(utils.iterJsonArray(file))
+    with instrument.span('events.stats'):
+        eventstats.update(utils.iterJsonArray(file))
+
+# active contracts as they should be stored
+def activeContracts(active: list["ei.Contract"]) -> list["ei.Contract"]:
     # remove first-contract from list
     active = [c for c in active if c.identifier != 'first-contract']
 
@@ -98,61 +195,158 @@ def getContracts(active: list["ei.Contract"], file: str) -> list["ContractStore"
         if c.grade_specs:
             c.goal_sets = []
             c.goals = []
+    return active
 
-    # read past events into list
-    with open(file, 'r', encoding="utf-8") as f:
-        past_contract_protos = json.load(f)
-    past = [utils.decode(ei.Contract(),contract['proto'], False)
-                      for contract in past_contract_protos]
-
-    recent = []
-    old = []
-    # get contracts that are still running
-    for c in past:
-        if c.expiration_time > time.time():
-            recent.append(c)
-            continue
-        old.append(c)
+# get list of all contracts from active contracts and past contract list
+# seasons, eggs: per-season contract files and custom egg index to keep up to date,
+# the caller saves them once the returned contracts are written
+def getContracts(active: list["ei.Contract"], file: str, index_file: str = defaults.contract_index_file,
+                 current_season: Optional["ei.ContractSeasonInfo"] = None,
+                 seasons: Optional[SeasonIndex] = None,
+                 eggs: Optional[CustomEggIndex] = None) -> Iterator["ContractStore"]:
+    active = activeContracts(active)
+
+    # read past contracts, only decoding the ones that could still be running
+    archive = ContractArchive.load(file, index_file)
+    now = time.time()
+    with instrument.span('contracts.live'):
+        recent = archive.live(now)
 
     # dedupe recent contract list, always replacing saved data with live api data
-    contracts = sorted(
+    current = sorted(
             unique_everseen(active + recent,
                             key = lambda x: x.identifier),
             key=lambda x: x .start_time)
 
-    seasonContracts = [ ContractStore(contract) for contract in old + contracts if contract.season_id == 'spring_2025' ]
-    with open('data/seasoncontracts.json', 'w', encoding="utf-8") as f:
-        json.dump(seasonContracts, f, sort_keys=True, indent=2)
-
-    # return list of all contracts in { id: contract id, proto: b64 contract proto } form
-    return [ ContractStore(contract) for contract in old + contracts ]
-
-def updateContracts(contracts: list[ei.Contract], file: str):
-    allContracts = getContracts(contracts, file)
-
-    with open(file, 'w', encoding="utf-8") as f:
-        json.dump(allContracts, f, sort_keys=True, indent=2)
+    contracts = []
+    for contract, proto in zip(current, utils.encodeMany(current)):
+        store = ContractStore(contract, proto)
+        archive.record(store, contract)
+        contracts.append(store)
+
+    # all contracts in { id: contract id, proto: b64 contract proto } form
+    # expired contracts keep their original encoding and are streamed from the
+    # archive again for each consumer instead of being held in memory
+    def allContracts() -> Iterator["ContractStore"]:
+        return itertools.chain(archive.expired(now), contracts)
+
+    if seasons is None:
+        seasons = SeasonIndex.load(defaults.seasons_dir)
+    with instrument.span('contracts.seasons'):
+        updateSeasons(seasons, archive, now, recent, contracts, allContracts, current_season)
+
+    if eggs is None:
+        eggs = CustomEggIndex.load(defaults.colleggtible_index_file)
+    with instrument.span('contracts.eggs'):
+        if eggs.matches(file):
+            for store in contracts:
+                eggs.add(archive.entry(store))
+        else:
+            eggs.rebuild(allContracts(), archive)
+
+    with instrument.span('contracts.index'):
+        archive.saveIndex(allContracts(), index_file)
+    print(f"Decoded {len(recent)} live contracts, {archive.misses} unindexed")
+    return allContracts()
+
+# per-season contract files and the current season's data/seasoncontracts.json
+# only seasons with a contract that was or is live get rewritten
+def updateSeasons(seasons: SeasonIndex, archive: ContractArchive, now: float, recent: list["ei.Contract"], contracts: list["ContractStore"],
+                  allContracts: Callable[[], Iterator["ContractStore"]], current_season: Optional["ei.ContractSeasonInfo"]):
+    seasons.describe(storedSeasonInfos(defaults.contract_seasons_file))
+    if current_season is not None and current_season.id:
+        seasons.describe([ContractSeasonIndexEntry(current_season)])
+    if seasons.complete(archive.file):
+        affected = {c.season_id for c in recent} | {archive.entry(store)['season_id'] for store in contracts}
+        seasons.update(affected, contracts, archive, now)
+    else:
+        os.makedirs(seasons.directory, exist_ok=True)
+        seasons.rebuild(allContracts(), archive)
+    seasons.currentSeason(current_season.id if current_season is not None else None, now)
+    seasons.writeCurrent(defaults.season_contract_file)
+
+def updateContracts(contracts: list[ei.Contract], file: str, current_season: Optional["ei.ContractSeasonInfo"] = None):
+    seasons = SeasonIndex.load(defaults.seasons_dir)
+    eggs = CustomEggIndex.load(defaults.colleggtible_index_file)
+    allContracts = getContracts(contracts, file, current_season = current_season, seasons = seasons, eggs = eggs)
+
+    output.writeJsonRecords(allContracts, file)
+    with instrument.span('contracts.binary'):
+        binarchive.write(utils.iterJsonArray(file), defaults.contract_binary_file)
+
+    # the season files and custom egg index now match the new archive
+    seasons.save(file)
+    eggs.save(file)
+
+# outputs derived from a contract archive that was written by something else than
+# updateContracts, e.g. exported from the sqlite store: the side index, season files,
+# custom egg index and binary archive are rebuilt from it
+def rebuildContractOutputs(file: str, current_season: Optional["ei.ContractSeasonInfo"] = None):
+    archive = ContractArchive.load(file, defaults.contract_index_file)
+    seasons = SeasonIndex.load(defaults.seasons_dir)
+    seasons.describe(storedSeasonInfos(defaults.contract_seasons_file))
+    if current_season is not None and current_season.id:
+        seasons.describe([ContractSeasonIndexEntry(current_season)])
+    os.makedirs(seasons.directory, exist_ok=True)
+    seasons.rebuild(archive.stores(), archive)
+    seasons.currentSeason(current_season.id if current_season is not None else None)
+    seasons.writeCurrent(defaults.season_contract_file)
+
+    eggs = CustomEggIndex.load(defaults.colleggtible_index_file)
+    eggs.rebuild(archive.stores(), archive)
+    archive.saveIndex(archive.stores(), defaults.contract_index_file)
+    binarchive.write(archive.stores(), defaults.contract_binary_file)
+    seasons.save(file)
+    eggs.save(file)
+
+# contracts using one of the custom eggs in egg_file, looked up through the custom egg index
+def updateColleggtibleContracts(contract_file: str, egg_file: str, file: str,
+                                index_file: str = defaults.colleggtible_index_file):
+    archive = ContractArchive.load(contract_file, defaults.contract_index_file)
+    eggs = CustomEggIndex.load(index_file)
+    if not eggs.matches(contract_file):
+        eggs.rebuild(archive.stores(), archive)
+        eggs.save(contract_file)
+
+    output.writeJsonRecords(colleggtibleContracts(archive, eggs, egg_file), file)
 
 # Get list of all contract seasons
-def getContractSeasons(season_info: ei.ContractSeasonInfos, file: str) -> list["ContractSeasonStore"]:
-
-    # read existing contract seasons into list
-    with open(file, 'r', encoding="utf-8") as f:
-        past_contract_season_protos = json.load(f)
-    existing = [utils.decode(ei.ContractSeasonInfo(), contract_season['proto'], False)
-            for contract_season in past_contract_season_protos]
+def getContractSeasons(season_info: ei.ContractSeasonInfos, file: str,
+                       index_file: str = defaults.contract_seasons_index_file) -> list["ContractSeasonStore"]:
+    # stored seasons are only looked up in the proto cache and keep their encoding
+    cache = seasonCache(index_file)
+    live = []
+    for season in season_info.infos:
+        store = ContractSeasonStore(season)
+        cache.put(store['proto'], ContractSeasonIndexEntry(season))
+        live.append(store)
 
     # dedupe, replacing saved data with live api data
     updated_list = sorted(
-        unique_everseen(season_info.infos + existing,
-                        key = lambda x: x.id),
-        key = lambda x: x .start_time)
+        unique_everseen(live + list(utils.iterJsonArray(file)),
+                        key = lambda x: cache.get(x['proto'])['id']),
+        key = lambda x: cache.get(x['proto'])['start_time'])
 
+    cache.save(index_file)
 
-    # return list of all contracts in { id: contract id, proto: b64 contract proto } form
-    return [ ContractSeasonStore(contract_season) for contract_season in updated_list ]
+    # return list of all contract seasons in { id: season id, proto: b64 season proto } form
+    return updated_list
 
 def updateContractSeasons(season_info: ei.ContractSeasonInfos, file: str):
+    fillSeasonStartTimes(season_info)
+
+    all_contract_seasons = getContractSeasons(season_info, file)
+
+    output.writeJson(all_contract_seasons, file)
+
+# bring the contract season proto cache up to date with a season archive written elsewhere
+def updateContractSeasonIndex(file: str, index_file: str = defaults.contract_seasons_index_file):
+    cache = seasonCache(index_file)
+    for store in utils.iterJsonArray(file):
+        cache.get(store['proto'])
+    cache.save(index_file)
+
+def fillSeasonStartTimes(season_info: ei.ContractSeasonInfos):
     # At time of writing there's no .start_time returned for four of the seasons.
     # Fill them in using the start time of the first contract in that season.
     # Note though the times we do have for other seasons are often an hour before this, or a few days.
@@ -168,13 +362,36 @@ def updateContractSeasons(season_info: ei.ContractSeasonInfos, file: str):
                 case 'summer_2024':
                     season.start_time = 1719244800 # Monday 24th June 2024 (summer-here-2024)
 
-    all_contract_seasons = getContractSeasons(season_info, file)
-
-    with open(file, 'w', encoding="utf-8") as f:
-        json.dump(all_contract_seasons, f, sort_keys=True, indent=2)
-
-
-def requestPeriodicals() -> bytes:
+# update the sqlite archive instead of merging into the json files, then export them from it
+def updateStore(periodicals: "ei.PeriodicalsResponse", season_info: "ei.ContractSeasonInfos", commands: set[str]):
+    with Store(defaults.store_file) as store:
+        # a missing database is created empty, seed it from the json archives before exporting over them
+        if not store.imported():
+            print(f"Importing {defaults.store_file} from the json archives")
+            store.importJson()
+        if "events" in commands:
+            store.upsertEvents(Event(event) for event in periodicals.events.events)
+        if "contracts" in commands:
+            store.upsertContracts(activeContracts(periodicals.contracts.contracts))
+        if "contractseasons" in commands:
+            fillSeasonStartTimes(season_info)
+            store.upsertSeasons(season_info.infos)
+        # only the archives whose subcommand ran
+        store.exportJson(defaults.contract_file if "contracts" in commands else None,
+                         defaults.event_file if "events" in commands else None,
+                         defaults.contract_seasons_file if "contractseasons" in commands else None)
+
+    # then everything the regular subcommands derive from those archives, seasons first
+    # as the season files take their names from contractseasons.json
+    if "contractseasons" in commands:
+        updateContractSeasonIndex(defaults.contract_seasons_file)
+    if "contracts" in commands:
+        rebuildContractOutputs(defaults.contract_file, periodicals.contracts.current_season)
+    if "events" in commands:
+        updateEventOutputs(defaults.event_file)
+
+# response body in chunks as it arrives
+def requestPeriodicals() -> Iterator[bytes]:
     periodicals_request = ei.GetPeriodicalsRequest(
     current_client_version = defaults.current_client_version,
     user_id                = defaults.user_id,
@@ -183,9 +400,9 @@ def requestPeriodicals() -> bytes:
 
     data = { 'data' : utils.encode(periodicals_request) }
 
-    return requests.post(defaults.url, data = data).content
+    return getClient().postStream(defaults.url, data = data)
 
-def requestSeasonInfo() -> bytes:
+def requestSeasonInfo() -> Iterator[bytes]:
     # GetPeriodicalsRequest works fine here too
     periodicals_request = ei.GetPeriodicalsRequest(
         current_client_version = defaults.current_client_version,
@@ -195,7 +412,7 @@ def requestSeasonInfo() -> bytes:
 
     data = { 'data' : utils.encode(periodicals_request) }
 
-    return requests.post(defaults.season_info_url, data = data).content
+    return getClient().postStream(defaults.season_info_url, data = data)
 
 # event object formatted in the way wasmegg/events wants it
 class Event(dict):
@@ -214,10 +431,10 @@ class Event(dict):
 
 # contract object formatted to persist with json
 class ContractStore(dict):
-    def __init__(self, contract: "ei.Contract"):
+    def __init__(self, contract: "ei.Contract", proto: Optional[str] = None):
         dict.__init__(self,
         id    = contract.identifier,
-        proto = utils.encode(contract))
+        proto = proto if proto is not None else utils.encode(contract))
 
     def toJson(self):
         return json.dumps(self, default=lambda o: o.__dict__)
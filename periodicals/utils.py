@@ -1,7 +1,15 @@
 import base64
-from typing import TypeVar
+import dataclasses
+import functools
+import itertools
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Sequence, TypeVar
 import betterproto
 import ei
+import instrument
 import zlib
 
 T = TypeVar("T", bound=betterproto.Message)
@@ -9,9 +17,345 @@ T = TypeVar("T", bound=betterproto.Message)
 def encode(message: "betterproto.Message") -> str:
     return base64.b64encode(bytes(message)).decode('utf-8')
 
-def decode(proto: T, encoded: bytes, authenticated = True) -> T:
+def decode(proto: T, encoded: bytes, authenticated = True, fields: Optional[Iterable[str]] = None) -> T:
     if authenticated:
-      auth_msg = decode(ei.AuthenticatedMessage(),encoded, False)
-      message = auth_msg.message if not auth_msg.compressed else zlib.decompress(auth_msg.message)
-      return proto.parse(message)
-    return proto.parse(base64.b64decode(encoded))
+      with instrument.span('decode.inflate'):
+        auth_msg = decode(ei.AuthenticatedMessage(),encoded, False)
+        message = auth_msg.message if not auth_msg.compressed else zlib.decompress(auth_msg.message)
+      with instrument.span('decode.parse'):
+        return parse(proto, message, fields)
+    instrument.count('records decoded')
+    return parse(proto, base64.b64decode(encoded), fields)
+
+# single pass authenticated decode of a response body arriving in chunks
+# base64 is decoded as the text comes in, the AuthenticatedMessage is walked at the
+# wire level and its payload inflated straight into one buffer that is parsed in
+# place, so at most one uncompressed copy of the payload is held. The compressed
+# flag comes after the payload on the wire, so the payload is also kept as received
+# in case it turns out to be stored as is.
+def decodeStream(proto: T, chunks: Iterable[bytes], fields: Optional[Iterable[str]] = None,
+                 out: Optional[bytearray] = None) -> T:
+    # out: buffer to inflate into, e.g. reused between calls
+    out = bytearray() if out is None else out
+    del out[:]
+    raw = bytearray()
+    inflater = zlib.decompressobj()
+    inflate_error = None
+    compressed = False
+
+    text = b''
+    pending = bytearray()
+    remaining = 0      # bytes of the payload (field 1) still to come
+    with instrument.span('decode.inflate'):
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                text += chunk.translate(None, b' \t\r\n')
+                usable = len(text) - len(text) % 4
+                pending += base64.b64decode(text[:usable])
+                text = text[usable:]
+            elif text:
+                pending += base64.b64decode(text)
+
+            pos = 0
+            while pos < len(pending):
+                if remaining:
+                    piece = memoryview(pending)[pos:pos + remaining]
+                    raw += piece
+                    if inflate_error is None:
+                        try:
+                            out += inflater.decompress(piece)
+                        except zlib.error as e:
+                            inflate_error = e
+                    remaining -= len(piece)
+                    pos += len(piece)
+                    piece.release()
+                    continue
+                try:
+                    key, value_pos = decodeVarint(pending, pos)
+                    number, wire_type = key >> 3, key & 0x7
+                    if wire_type == 0:
+                        value, end = decodeVarint(pending, value_pos)
+                    elif wire_type == 2:
+                        length, value_pos = decodeVarint(pending, value_pos)
+                        if number == 1:
+                            remaining = length
+                            pos = value_pos
+                            continue
+                        end = value_pos + length
+                    else:
+                        end = value_pos + (8 if wire_type == 1 else 4)
+                except IndexError:
+                    # the rest of this field hasn't arrived yet
+                    break
+                if end > len(pending):
+                    break
+                if number == 4 and wire_type == 0:
+                    compressed = bool(value)
+                pos = end
+            del pending[:pos]
+            if chunk is None and (pending or remaining):
+                raise ValueError("Truncated AuthenticatedMessage")
+
+        if compressed:
+            if inflate_error is not None:
+                raise inflate_error
+            out += inflater.flush()
+            del raw[:]
+            payload = out
+        else:
+            del out[:]
+            payload = raw
+
+    with instrument.span('decode.parse'):
+        if fields is None:
+            return proto.parse(payload)
+        return proto.parse(project(type(proto), payload, projection(fields)))
+
+# bulk decode/encode of b64 protos, e.g. the whole contract archive
+# chunks go to a process pool once there are enough protos to pay for starting the
+# workers and pickling messages across, serially otherwise. Decoded messages cost
+# about a third of their parse time to unpickle, but encoding is so cheap that
+# pickling the messages to the workers eats most of the gain, hence the much higher
+# encode threshold. bench/bulk_codec.py measures the crossover on a given machine.
+decode_threshold = 1024
+encode_threshold = 16384
+
+# decodeMany counts the whole batch, so this skips decode()'s per-record counter
+def _decodeChunk(chunk: Sequence[str], cls: type, authenticated: bool) -> list:
+    if authenticated:
+        return [decode(cls(), encoded) for encoded in chunk]
+    return [cls().parse(base64.b64decode(encoded)) for encoded in chunk]
+
+def _encodeChunk(chunk: Sequence["betterproto.Message"]) -> list[str]:
+    return [encode(message) for message in chunk]
+
+def _bulk(fn, items: Sequence, workers: Optional[int], threshold: int) -> list:
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(items) < max(threshold, 2):
+        return fn(items)
+    # a few chunks per worker so a slow chunk doesn't hold up the rest
+    size = -(-len(items) // (workers * 4))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+        return [item for chunk in pool.map(fn, chunks) for item in chunk]
+
+def decodeMany(cls: type[T], encoded: Sequence[str], authenticated = False,
+               workers: Optional[int] = None, threshold: Optional[int] = None) -> list[T]:
+    instrument.count('records decoded', len(encoded))
+    with instrument.span('decodeMany'):
+      return _bulk(functools.partial(_decodeChunk, cls=cls, authenticated=authenticated), encoded, workers,
+                   decode_threshold if threshold is None else threshold)
+
+def encodeMany(messages: Sequence["betterproto.Message"],
+               workers: Optional[int] = None, threshold: Optional[int] = None) -> list[str]:
+    instrument.count('records encoded', len(messages))
+    with instrument.span('encodeMany'):
+      return _bulk(_encodeChunk, messages, workers, encode_threshold if threshold is None else threshold)
+
+# parse raw proto bytes, optionally keeping only the given field paths
+def parse(proto: T, data: bytes, fields: Optional[Iterable[str]] = None) -> T:
+    if fields is None:
+        return proto.parse(data)
+    return proto.parse(project(type(proto), data, projection(fields)))
+
+def decodeVarint(buf: memoryview, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        result |= (b & 0x7F) << shift
+        pos += 1
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Too many bytes when decoding varint.")
+
+# walk the top level fields of an encoded message without decoding them
+# yields (field number, wire type, start of the tag, start of the value, end of the field)
+# for length-delimited fields the value excludes the length prefix
+def iterFields(buf: memoryview) -> Iterator[tuple[int, int, int, int, int]]:
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        start = pos
+        key, pos = decodeVarint(buf, pos)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            _, value_end = decodeVarint(buf, pos)
+        elif wire_type == 1:
+            value_end = pos + 8
+        elif wire_type == 2:
+            length, pos = decodeVarint(buf, pos)
+            value_end = pos + length
+        elif wire_type == 5:
+            value_end = pos + 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} for field {number}")
+        if value_end > end:
+            raise ValueError(f"Truncated field {number}")
+        yield number, wire_type, start, pos, value_end
+        pos = value_end
+
+# turn dotted field paths into a tree, an empty subtree means keep the whole field
+# e.g. ["contracts.contracts", "events"] -> {"contracts": {"contracts": {}}, "events": {}}
+def projection(fields: Iterable[str]) -> dict:
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        parts = path.split('.')
+        for i, part in enumerate(parts):
+            if part in node and not node[part]:
+                # an ancestor of this path is already kept whole
+                break
+            node = node.setdefault(part, {})
+            if i == len(parts) - 1:
+                node.clear()
+    return tree
+
+# field number -> (field name, message class or None) for a message class
+@functools.cache
+def fieldTable(cls: type) -> dict[int, tuple[str, Optional[type]]]:
+    table = {}
+    for field in dataclasses.fields(cls):
+        meta = betterproto.FieldMetadata.get(field)
+        sub = cls._cls_for(field) if meta.proto_type == betterproto.TYPE_MESSAGE else None
+        table[meta.number] = (field.name, sub if isinstance(sub, type) and issubclass(sub, betterproto.Message) else None)
+    return table
+
+# copy only the projected fields of an encoded message, dropping everything else
+# at the wire level so skipped sub-messages are never parsed
+def project(cls: type, data: bytes, tree: dict) -> bytes:
+    buf = memoryview(data)
+    table = fieldTable(cls)
+    out = bytearray()
+    for number, wire_type, start, value_start, end in iterFields(buf):
+        name, sub = table.get(number, (None, None))
+        if name not in tree:
+            continue
+        subtree = tree[name]
+        if not subtree or sub is None or wire_type != 2:
+            out += buf[start:end]
+            continue
+        inner = project(sub, buf[value_start:end], subtree)
+        out += betterproto.encode_varint((number << 3) | 2)
+        out += betterproto.encode_varint(len(inner))
+        out += inner
+    return bytes(out)
+
+# value readers for scanning scalar fields off the wire, by proto type
+_SIGNED = (betterproto.TYPE_INT32, betterproto.TYPE_INT64)
+_FIXED = {
+    betterproto.TYPE_DOUBLE: struct.Struct('<d'),
+    betterproto.TYPE_FLOAT: struct.Struct('<f'),
+    betterproto.TYPE_FIXED32: struct.Struct('<I'),
+    betterproto.TYPE_FIXED64: struct.Struct('<Q'),
+    betterproto.TYPE_SFIXED32: struct.Struct('<i'),
+    betterproto.TYPE_SFIXED64: struct.Struct('<q'),
+}
+
+def _scanValue(proto_type: str, buf: memoryview, value_start: int, end: int):
+    if proto_type == betterproto.TYPE_STRING:
+        return str(buf[value_start:end], 'utf-8')
+    if proto_type == betterproto.TYPE_BYTES:
+        return bytes(buf[value_start:end])
+    if proto_type in _FIXED:
+        return _FIXED[proto_type].unpack_from(buf, value_start)[0]
+    value, _ = decodeVarint(buf, value_start)
+    if proto_type in _SIGNED and value >> 63:
+        # negative int32 and int64 are sign extended to 64 bits
+        value -= 1 << 64
+    elif proto_type in (betterproto.TYPE_SINT32, betterproto.TYPE_SINT64):
+        value = (value >> 1) ^ -(value & 1)
+    elif proto_type == betterproto.TYPE_BOOL:
+        value = value > 0
+    return value
+
+# field number -> (name, proto type, default) of the named scalar fields of a message class
+@functools.cache
+def scanTable(cls: type, names: tuple[str, ...]) -> dict[int, tuple[str, str, object]]:
+    table = {}
+    for field in dataclasses.fields(cls):
+        if field.name not in names:
+            continue
+        meta = betterproto.FieldMetadata.get(field)
+        if meta.proto_type in (betterproto.TYPE_MESSAGE, betterproto.TYPE_MAP):
+            raise TypeError(f"{cls.__name__}.{field.name} isn't a scalar field")
+        default = '' if meta.proto_type == betterproto.TYPE_STRING else b'' if meta.proto_type == betterproto.TYPE_BYTES \
+            else 0.0 if meta.proto_type in (betterproto.TYPE_DOUBLE, betterproto.TYPE_FLOAT) \
+            else False if meta.proto_type == betterproto.TYPE_BOOL else 0
+        table[meta.number] = (field.name, meta.proto_type, default)
+    return table
+
+# pull the named top level scalar fields straight from encoded message bytes without
+# building message objects, fields that aren't on the wire get their default
+def scanFields(cls: type, data: bytes, names: tuple[str, ...]) -> dict:
+    table = scanTable(cls, names)
+    result = { name: default for name, _, default in table.values() }
+    buf = memoryview(data)
+    for number, wire_type, start, value_start, end in iterFields(buf):
+        field = table.get(number)
+        if field is not None:
+            # later occurrences of a scalar field win, as in a full parse
+            result[field[0]] = _scanValue(field[1], buf, value_start, end)
+    return result
+
+# the Contract fields most readers of the archive need
+CONTRACT_SCAN_FIELDS = ('identifier', 'start_time', 'expiration_time', 'season_id', 'egg', 'custom_egg_id')
+
+# scan the given fields of each { id, proto: b64 contract } store
+def scanContracts(stores: Iterable[dict], fields: tuple[str, ...] = CONTRACT_SCAN_FIELDS) -> Iterator[dict]:
+    for store in stores:
+        yield scanFields(ei.Contract, base64.b64decode(store['proto']), fields)
+
+# stream the elements of a top level json array from a file without loading it whole
+def iterJsonArray(file: str, chunk_size: int = 64 * 1024) -> Iterator:
+    decoder = json.JSONDecoder()
+    with open(file, 'r', encoding="utf-8") as f:
+        buf = ''
+        pos = 0
+        eof = False
+
+        # position of the next non-whitespace character, reading more as needed
+        def next_char() -> int:
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\n\r':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return pos
+                buf, pos = f.read(chunk_size), 0
+                eof = not buf
+
+        if next_char() >= len(buf) or buf[pos] != '[':
+            raise ValueError(f"{file} does not contain a json array")
+        pos += 1
+        if next_char() < len(buf) and buf[pos] == ']':
+            return
+        while True:
+            next_char()
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # a value is only complete once the next separator is in the buffer,
+                # otherwise e.g. a number may continue in the next chunk
+                after = end
+                while after < len(buf) and buf[after] in ' \t\n\r':
+                    after += 1
+                if not eof and (after == len(buf) or buf[after] not in ',]'):
+                    raise json.JSONDecodeError("incomplete", buf, end)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield value
+            pos = end
+            if next_char() >= len(buf):
+                raise ValueError(f"{file} ends inside a json array")
+            if buf[pos] == ']':
+                return
+            if buf[pos] != ',':
+                raise ValueError(f"unexpected {buf[pos]!r} in json array in {file}")
+            pos += 1